@@ -0,0 +1,34 @@
+# build_icons.py
+# Pre-render the tab icons so startup does not need the qtawesome font pipeline.
+# Run from the project root after changing an icon or the brand colour:
+#     python assets/build_icons.py
+
+import sys
+from pathlib import Path
+
+from PyQt6.QtWidgets import QApplication
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import assets.styles as styles
+
+ICON_DIR = Path(__file__).parent / "icons"
+ICON_SIZE = 32  # 2x the tab icon size so it stays sharp on HiDPI screens
+
+# output file -> qtawesome name
+TAB_ICONS = {
+    "table.png": "fa5s.table",
+    "robot.png": "fa5s.robot",
+}
+
+
+def main():
+    app = QApplication(sys.argv)
+    ICON_DIR.mkdir(exist_ok=True)
+    for filename, name in TAB_ICONS.items():
+        icon = styles.cached_icon(name, styles.COLORS["brand_primary"])
+        icon.pixmap(ICON_SIZE, ICON_SIZE).save(str(ICON_DIR / filename))
+        print(f"Wrote {ICON_DIR / filename}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 # MyOffer Monitor - Branded Light Theme
 # Clean, professional design with MyOffer blue brand colors
 
+from functools import lru_cache
+
 # --- COLOR PALETTE ---
 # Brand colors from the logo
 COLORS = {
@@ -236,7 +238,7 @@ MODERN_STYLESHEET = f"""
     /* ============================================
        TABLE - Clean with brand accents
        ============================================ */
-    QTableWidget {{
+    QTableView {{
         background-color: {COLORS["bg_white"]};
         border: 1px solid {COLORS["border"]};
         border-radius: 0;
@@ -246,12 +248,12 @@ MODERN_STYLESHEET = f"""
         outline: none;
     }}
     
-    QTableWidget::item {{
+    QTableView::item {{
         padding: 6px 12px;
         border-bottom: 1px solid {COLORS["divider"]};
     }}
     
-    QTableWidget::item:selected {{
+    QTableView::item:selected {{
         background-color: {COLORS["accent_light"]};
     }}
     
@@ -475,6 +477,92 @@ MODERN_STYLESHEET = f"""
         font-weight: 600;
     }}
 
+    QLabel#filter_arrow {{
+        color: {COLORS["text_secondary"]};
+        font-size: 10px;
+        background: transparent;
+        margin-left: -20px;
+    }}
+
+    QLabel#client_count_label {{
+        color: {COLORS["text_secondary"]};
+    }}
+
+    /* ============================================
+       SITE MAP DIALOGS - one label per harvested link
+       ============================================ */
+    QScrollArea#site_map_scroll {{
+        border: none;
+        background-color: {COLORS["bg_white"]};
+    }}
+
+    QLabel#site_map_meta {{
+        color: {COLORS["text_secondary"]};
+    }}
+
+    QLabel#site_map_link {{
+        color: {COLORS["brand_primary"]};
+        font-size: 11px;
+    }}
+
+    QLabel#site_map_category {{
+        margin-top: 8px;
+    }}
+
+    QLabel#site_map_url {{
+        color: {COLORS["brand_primary"]};
+        padding-left: 10px;
+    }}
+
+    QLabel#site_map_not_found {{
+        color: {COLORS["text_tertiary"]};
+        font-style: italic;
+        padding-left: 10px;
+    }}
+
+    QLabel#site_map_other {{
+        color: {COLORS["text_secondary"]};
+        margin-top: 5px;
+    }}
+
+    QLabel#site_map_empty {{
+        color: {COLORS["text_secondary"]};
+        padding: 20px;
+    }}
+
+    /* ============================================
+       APP HEADER - Logo, title and version
+       ============================================ */
+    QWidget#app_header {{
+        background-color: {COLORS["bg_white"]};
+        border-bottom: none;
+        margin-bottom: 3px;
+    }}
+
+    QLabel#app_logo {{
+        background: transparent;
+        border-bottom: none;
+        margin-bottom: 3px;
+    }}
+
+    QLabel#app_title {{
+        font-size: 20px;
+        font-weight: 700;
+        color: {COLORS["brand_dark"]};
+        background: transparent;
+        padding-left: 12px;
+        border-bottom: none;
+        margin-bottom: 3px;
+    }}
+
+    QLabel#app_version {{
+        font-size: 11px;
+        color: {COLORS["text_tertiary"]};
+        background: transparent;
+        border-bottom: none;
+        margin-bottom: 3px;
+    }}
+
     /* ============================================
        STATUS BAR
        ============================================ */
@@ -570,8 +658,73 @@ MODERN_STYLESHEET = f"""
     }}
 """
 
+# --- TABLE LAYOUT ---
+# Shared by the Manager and Scanner tables. Column 1 (URL) stretches.
+# 0: Client Name, 1: URL, 2: Expected Provider, 3: Detected Provider, 4: Config,
+# 5: Status, 6: Details, 7: Site Map, 8: Offer, 9: Active
+TABLE_COLUMN_WIDTHS = (300, None, 150, 150, 70, 110, 120, 80, 180, 65)
+TABLE_ROW_HEIGHT = 30
+TABLE_STRETCH_COLUMN = 1
+
+
 # --- STYLE HELPERS ---
 
+def apply_table_layout(table):
+    """Give a client table fixed-height, non-wrapping rows and the preset column widths.
+
+    Nothing is sized from cell contents, so inserting or repainting rows never
+    triggers a measuring pass.
+    """
+    from PyQt6.QtWidgets import QHeaderView
+    header = table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+    header.setSectionResizeMode(TABLE_STRETCH_COLUMN, QHeaderView.ResizeMode.Stretch)
+    for col, width in enumerate(TABLE_COLUMN_WIDTHS):
+        if width is not None:
+            table.setColumnWidth(col, width)
+
+    rows = table.verticalHeader()
+    rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    rows.setDefaultSectionSize(TABLE_ROW_HEIGHT)
+    table.setWordWrap(False)
+
+
+@lru_cache(maxsize=256)
+def cached_icon(name: str, color: str):
+    """Get a qtawesome icon, built once per (name, color) and shared across widgets."""
+    import qtawesome as qta
+    return qta.icon(name, color=color)
+
+
+@lru_cache(maxsize=None)
+def bold_table_font():
+    """Bold font for status cells, built once and shared by both tables."""
+    from PyQt6.QtGui import QFont
+    return QFont("Arial", 10, QFont.Weight.Bold)
+
+
+# Status text -> row_brushes() key; anything not listed is styled as pending
+STATUS_ROW_STYLE = {
+    'PASS': 'pass',
+    'WARN': 'warn',
+    'BLOCKED': 'warn',
+    'FAIL': 'fail',
+    'ERROR': 'fail',
+    'UNVERIFIABLE': 'unverifiable',
+    'N/A': 'unverifiable',
+    'PENDING': 'pending',
+}
+
+
+@lru_cache(maxsize=None)
+def row_brushes() -> dict:
+    """(background, foreground) QBrush pairs per row style, built once and shared."""
+    from PyQt6.QtGui import QBrush, QColor
+    return {
+        key: (QBrush(QColor(COLORS[f"row_{key}_bg"])), QBrush(QColor(COLORS[f"row_{key}_text"])))
+        for key in ("pass", "warn", "fail", "unverifiable", "pending", "inactive", "blocked")
+    }
+
 def get_status_style(status: str) -> dict:
     """Get background and text colors for a status."""
     status_map = {
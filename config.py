@@ -147,7 +147,7 @@ LOGGING_CONFIG = {
             'level': 'DEBUG',
             'formatter': 'detailed',
             'filename': str(LOGS_DIR / 'mom.log'),
-            'maxBytes': 10485760,  # 10MB
+            'maxBytes': 5242880,  # 5MB
             'backupCount': 5,
             'encoding': 'utf-8',
         },
@@ -106,6 +106,10 @@ class Database:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
+                # WAL keeps small writes (settings, scan results) from
+                # rewriting the main database file
+                cursor.execute("PRAGMA journal_mode=WAL")
+                
                 # Create tables
                 cursor.execute(CREATE_SITES_TABLE)
                 cursor.execute(CREATE_SCAN_HISTORY_TABLE)
@@ -509,6 +513,39 @@ class Database:
             if logger:
                 logger.error("Failed to cleanup old backups", exception=e)
     
+    # ========================================================================
+    # SETTINGS
+    # ========================================================================
+    
+    def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a value from the app_settings key/value table"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT value FROM app_settings WHERE key = ?", (key,))
+                row = cursor.fetchone()
+                return row['value'] if row else default
+        except Exception as e:
+            if logger:
+                logger.error("Failed to get setting", exception=e, key=key)
+            return default
+    
+    def set_setting(self, key: str, value: str):
+        """Insert or update a value in the app_settings key/value table"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute(
+                    """INSERT INTO app_settings (key, value) VALUES (?, ?)
+                       ON CONFLICT(key) DO UPDATE SET value = excluded.value,
+                                                      updated_at = CURRENT_TIMESTAMP""",
+                    (key, value)
+                )
+                conn.commit()
+        except Exception as e:
+            if logger:
+                logger.error("Failed to set setting", exception=e, key=key)
+            raise
+    
     # ========================================================================
     # MAINTENANCE
     # ========================================================================
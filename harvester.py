@@ -9,10 +9,18 @@ from pathlib import Path
 from urllib.parse import urlparse, urljoin
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Data directory for site maps
 DATA_DIR = Path("data")
 SITE_MAPS_FILE = DATA_DIR / "site_maps.json"
 
+# Read-only copy of site_maps.json keyed by the file's (mtime, size)
+_site_maps_cache = (None, {})
+
 # Category display order (priority-based)
 CATEGORY_ORDER = [
     "New Inventory",
@@ -166,8 +174,9 @@ def load_site_maps() -> Dict:
     """Load site maps from JSON file."""
     try:
         if SITE_MAPS_FILE.exists():
-            with open(SITE_MAPS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # One read of the whole file, then a single decode
+            raw = SITE_MAPS_FILE.read_bytes()
+            return orjson.loads(raw) if orjson else json.loads(raw)
     except Exception as e:
         print(f"Error loading site maps: {e}")
     return {}
@@ -177,17 +186,33 @@ def save_site_maps(data: Dict) -> bool:
     """Save site maps to JSON file."""
     try:
         DATA_DIR.mkdir(exist_ok=True)
-        with open(SITE_MAPS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson:
+            SITE_MAPS_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(SITE_MAPS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         return True
     except Exception as e:
         print(f"Error saving site maps: {e}")
         return False
 
 
+def _cached_site_maps() -> Dict:
+    """Site maps for lookups; the JSON is re-read only when the file changes."""
+    global _site_maps_cache
+    try:
+        stat = SITE_MAPS_FILE.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return {}
+    if _site_maps_cache[0] != key:
+        _site_maps_cache = (key, load_site_maps())
+    return _site_maps_cache[1]
+
+
 def get_site_map(url: str) -> Optional[Dict]:
     """Get stored site map for a URL's domain."""
-    site_maps = load_site_maps()
+    site_maps = _cached_site_maps()
     domain = get_domain(url)
     return site_maps.get(domain)
 
@@ -6,6 +6,9 @@ Provides structured, professional logging capabilities
 import logging
 import logging.handlers
 import logging.config
+import gzip
+import os
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -25,6 +28,16 @@ except ImportError:
 # LOGGER SETUP
 # ============================================================================
 
+def _gzip_namer(name: str) -> str:
+    """Name rotated backups mom.log.N.gz"""
+    return name + '.gz'
+
+def _gzip_rotator(source: str, dest: str):
+    """Gzip the just-closed log file into its first backup slot"""
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        dst.writelines(src)
+    os.remove(source)
+
 def setup_logging():
     """Initialize the logging system"""
     if LOGGING_CONFIG:
@@ -38,12 +51,20 @@ def setup_logging():
                 logging.StreamHandler(sys.stdout),
                 logging.handlers.RotatingFileHandler(
                     LOGS_DIR / 'mom.log',
-                    maxBytes=10485760,
-                    backupCount=5
+                    maxBytes=5242880,
+                    backupCount=5,
+                    encoding='utf-8'
                 )
             ]
         )
     
+    # Compress backups as the handler rotates them (mom.log.1.gz ...), so
+    # they are renumbered and pruned by backupCount like plain backups
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.handlers.RotatingFileHandler):
+            handler.namer = _gzip_namer
+            handler.rotator = _gzip_rotator
+    
     # Set level from settings if available
     if app_settings and hasattr(app_settings, 'log_level'):
         level = getattr(logging, app_settings.log_level, logging.INFO)
@@ -174,6 +195,14 @@ def install_exception_handler():
 # LOG VIEWER HELPERS
 # ============================================================================
 
+def _tail_lines(log_file: Path, max_lines: int, level: Optional[str] = None) -> list:
+    """Return the last max_lines lines of a (possibly gzipped) log file"""
+    opener = gzip.open if log_file.suffix == '.gz' else open
+    with opener(log_file, 'rt', encoding='utf-8', errors='replace') as f:
+        if level:
+            f = (l for l in f if f" - {level} - " in l)
+        return list(deque(f, maxlen=max_lines))
+
 def get_recent_logs(max_lines: int = 100, level: Optional[str] = None) -> list:
     """
     Get recent log entries
@@ -190,15 +219,15 @@ def get_recent_logs(max_lines: int = 100, level: Optional[str] = None) -> list:
         return []
     
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        lines = _tail_lines(log_file, max_lines, level)
         
-        # Filter by level if specified
-        if level:
-            lines = [l for l in lines if f" - {level} - " in l]
+        # Just rotated: top up from the previous segment
+        if len(lines) < max_lines:
+            previous = Path(_gzip_namer(str(log_file) + '.1'))
+            if previous.exists():
+                lines = _tail_lines(previous, max_lines - len(lines), level) + lines
         
-        # Return most recent lines
-        return lines[-max_lines:]
+        return lines
     except Exception as e:
         return [f"Error reading log file: {e}"]
 
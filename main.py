@@ -1,23 +1,29 @@
 import sys
 import os
 import json
-import qtawesome as qta
+import time
+import numpy as np
 from datetime import datetime
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QTabWidget, QMessageBox, 
                              QVBoxLayout, QHBoxLayout, QWidget, QLabel)
 from PyQt6.QtGui import QAction, QPixmap, QIcon
-from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtCore import (Qt, QSize, QTimer, QThreadPool, QRunnable, QObject, pyqtSignal,
+                          QSignalBlocker)
 
-from tabs.manager_tab import ManagerTab
-from tabs.scanner_tab import ScannerTab
+from tabs.manager_tab import ManagerTab, read_project_csv, normalize_project_frame, pyarrow_csv
 
 import assets.styles as styles 
 
-from config import app_settings, save_settings
+from config import app_settings, save_settings, ENABLE_DATABASE
 from logger import get_logger
 from database import get_database
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 # Data directory for auto-saves and settings
@@ -28,19 +34,30 @@ DATA_DIR.mkdir(exist_ok=True)
 LOGO_PATH = Path("assets/logo.png")
 LOGO_PATH_FLAT = Path("assets/logo2.png")
 
+# Pre-rendered tab icons (regenerate with assets/build_icons.py)
+TAB_ICON_MANAGER = Path("assets/icons/table.png")
+TAB_ICON_SCANNER = Path("assets/icons/robot.png")
+
 # Settings file for remembering last opened file
 RECENT_FILE_PATH = DATA_DIR / "recent_project.json"
 
+# Autosave names sort by time: autosave_YYYYmmdd_HHMMSS.csv
+AUTOSAVE_STAMP_FORMAT = "%Y%m%d_%H%M%S"
+
 
 def get_last_opened_file() -> str:
     """Get the path to the last opened file, if it exists."""
     try:
-        if RECENT_FILE_PATH.exists():
-            with open(RECENT_FILE_PATH, 'r') as f:
-                data = json.load(f)
-                path = data.get('last_file', '')
-                if path and os.path.exists(path):
-                    return path
+        path = ''
+        if ENABLE_DATABASE:
+            path = get_database().get_setting('last_file', '')
+        if not path and RECENT_FILE_PATH.exists():
+            # Legacy JSON state file, used when the database is disabled
+            raw = RECENT_FILE_PATH.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            path = data.get('last_file', '')
+        if path and os.path.exists(path):
+            return path
     except Exception as e:
         logger.warning("Could not load recent file", exception=e)
     return ''
@@ -49,16 +66,111 @@ def get_last_opened_file() -> str:
 def save_last_opened_file(file_path: str):
     """Save the path to the most recently opened file."""
     try:
+        if ENABLE_DATABASE:
+            # Single upsert into app_settings instead of rewriting a JSON file
+            get_database().set_setting('last_file', file_path)
+            return
         DATA_DIR.mkdir(exist_ok=True)
-        with open(RECENT_FILE_PATH, 'w') as f:
-            json.dump({
-                'last_file': file_path,
-                'saved_at': datetime.now().isoformat()
-            }, f, indent=2)
+        data = {
+            'last_file': file_path,
+            'saved_at': datetime.now().isoformat()
+        }
+        if orjson:
+            RECENT_FILE_PATH.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            RECENT_FILE_PATH.write_text(json.dumps(data, indent=2))
     except Exception as e:
         logger.warning("Could not save recent file path", exception=e)
 
 
+def cleanup_old_autosaves():
+    """Keep only the 5 most recent auto-saves."""
+    try:
+        autosaves = sorted(DATA_DIR.glob("autosave_*.csv"), reverse=True)
+        for old_file in autosaves[5:]:
+            old_file.unlink()
+    except Exception as e:
+        logger.warning("Could not cleanup old autosaves", exception=e)
+
+
+def latest_autosave():
+    """Return (path, mtime) of the newest autosave in DATA_DIR, or (None, 0)."""
+    latest = None
+    try:
+        # One directory pass; autosave names embed a sortable timestamp
+        with os.scandir(DATA_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("autosave_") and name.endswith(".csv"):
+                    if latest is None or name > latest.name:
+                        latest = entry
+        if latest is not None:
+            return latest.path, latest.stat().st_mtime
+    except OSError as e:
+        logger.warning("Could not scan for autosaves", exception=e)
+    return None, 0
+
+
+class _AutosaveSignals(QObject):
+    """Signals for _AutosaveJob (QRunnable can't define signals itself)."""
+    finished = pyqtSignal(str, bool)  # path, success
+
+
+class _AutosaveJob(QRunnable):
+    """Writes an auto-save snapshot from a QThreadPool worker thread."""
+
+    def __init__(self, df, path, signals):
+        super().__init__()
+        self.df = df
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        ok = False
+        try:
+            pacsv = pyarrow_csv()
+            if pacsv is not None:
+                # C++ writer; much faster than DataFrame.to_csv for wide frames
+                import pyarrow as pa
+                pacsv.write_csv(pa.Table.from_pandas(self.df, preserve_index=False), self.path)
+            else:
+                self.df.to_csv(self.path, index=False)
+            ok = True
+            logger.info("Auto-save completed", path=str(self.path))
+            # Clean up old auto-saves (keep only last 5)
+            cleanup_old_autosaves()
+        except Exception as e:
+            logger.error("Auto-save failed", exception=e)
+        finally:
+            # Delivered to the GUI thread as a queued signal
+            self.signals.finished.emit(str(self.path), ok)
+
+
+class _ProjectLoadSignals(QObject):
+    """Signals for _ProjectLoadJob."""
+    finished = pyqtSignal(str, object)  # path, DataFrame (None on failure)
+
+
+class _ProjectLoadJob(QRunnable):
+    """Reads the startup project CSV on a QThreadPool worker thread."""
+
+    def __init__(self, path, columns, signals):
+        super().__init__()
+        self.path = path
+        self.columns = columns
+        self.signals = signals
+
+    def run(self):
+        df = None
+        try:
+            df = normalize_project_frame(read_project_csv(self.path, self.columns), self.columns)
+        except Exception as e:
+            logger.warning("Could not load last project", exception=e)
+        finally:
+            # Delivered to the GUI thread as a queued signal
+            self.signals.finished.emit(self.path, df)
+
+
 class MainApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -89,13 +201,7 @@ class MainApp(QMainWindow):
         # --- Header with Logo ---
         header_widget = QWidget()
         header_widget.setFixedHeight(60)
-        header_widget.setStyleSheet(f"""
-            QWidget {{
-                background-color: {styles.COLORS["bg_white"]};
-                border-bottom: none;
-                margin-bottom: 3px;
-            }}
-        """)
+        header_widget.setObjectName("app_header")
         header_layout = QHBoxLayout(header_widget)
         header_layout.setContentsMargins(20, 10, 20, 10)
         
@@ -104,31 +210,19 @@ class MainApp(QMainWindow):
             logo_label = QLabel()
             logo_pixmap = QPixmap(str(LOGO_PATH_FLAT))
             logo_label.setPixmap(logo_pixmap.scaledToHeight(40, Qt.TransformationMode.SmoothTransformation))
-            logo_label.setStyleSheet("background: transparent;border-bottom:none;")
+            logo_label.setObjectName("app_logo")
             header_layout.addWidget(logo_label)
         
         # App Title
         title_label = QLabel("MyOffer Monitor")
-        title_label.setStyleSheet(f"""
-            font-size: 20px;
-            font-weight: 700;
-            color: {styles.COLORS["brand_dark"]};
-            background: transparent;
-            padding-left: 12px;
-            border-bottom: none;
-        """)
+        title_label.setObjectName("app_title")
         header_layout.addWidget(title_label)
         
         header_layout.addStretch()
         
         # Version label
         version_label = QLabel("v1.0.0")
-        version_label.setStyleSheet(f"""
-            font-size: 11px;
-            color: {styles.COLORS["text_tertiary"]};
-            background: transparent;
-            border-bottom: none;
-        """)
+        version_label.setObjectName("app_version")
         header_layout.addWidget(version_label)
         
         main_layout.addWidget(header_widget)
@@ -143,14 +237,14 @@ class MainApp(QMainWindow):
 
         # Initialize the tabs
         self.manager = ManagerTab()
-        self.scanner = ScannerTab()
+        # The scanner is built on first activation; a placeholder holds its tab
+        self.scanner = None
 
         self.tabs.addTab(self.manager, "  Data Manager")
-        self.tabs.addTab(self.scanner, "  Site Scanner")
+        self.tabs.addTab(QWidget(), "  Site Scanner")
         
-        # Add icons to tabs (using brand color)
-        self.tabs.setTabIcon(0, qta.icon('fa5s.table', color=styles.COLORS["brand_primary"]))
-        self.tabs.setTabIcon(1, qta.icon('fa5s.robot', color=styles.COLORS["brand_primary"]))
+        # Tab icons are loaded after the first paint
+        QTimer.singleShot(0, self._install_tab_icons)
         
         main_layout.addWidget(self.tabs)
 
@@ -163,12 +257,37 @@ class MainApp(QMainWindow):
         
         # Active clients count (right side)
         self.client_count_label = QLabel("Active Clients: 0")
-        self.client_count_label.setStyleSheet(f"color: {styles.COLORS['text_secondary']};")
+        self.client_count_label.setObjectName("client_count_label")
         self.statusBar().addWidget(self.client_count_label)
 
+        # --- Scan Result Batching ---
+        # Scanner results are queued and applied to the manager table in one
+        # pass every 50 ms instead of repainting once per result.
+        self._pending_updates = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_updates)
+
+        # --- Sync Debounce ---
+        # Bursts of manager edits collapse into one scanner reload
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(150)
+        self._sync_timer.timeout.connect(self._do_sync)
+
+        # --- Change Tracking ---
+        # Bumped on every manager edit so sync_data can skip unchanged data
+        self._df_version = 0
+        self._last_synced_version = -1
+
         # --- Signal Connections ---
+        self.manager.data_modified.connect(self._mark_dirty)
+        self.manager.data_modified.connect(self._bump_df_version)
         self.manager.data_modified.connect(self.sync_data)
-        self.scanner.scan_update_signal.connect(self.update_master_record)
+        # In-place cell edits don't go through the undo stack, so track them too
+        self.manager.model.cell_edited.connect(self._mark_dirty)
+        self.manager.model.cell_edited.connect(self._bump_df_version)
         self.tabs.currentChanged.connect(self.on_tab_changed)
         
         # --- Keyboard Shortcuts ---
@@ -178,6 +297,11 @@ class MainApp(QMainWindow):
         self.addAction(save_action)
 
         # --- Auto-save Timer ---
+        # Only write when something changed since the last auto-save
+        self._dirty = False
+        self._autosave_inflight = False
+        self._autosave_signals = _AutosaveSignals(self)
+        self._autosave_signals.finished.connect(self._on_autosave_finished)
         if app_settings.auto_save_enabled:
             self.auto_save_timer = QTimer()
             self.auto_save_timer.timeout.connect(self.auto_save)
@@ -185,25 +309,60 @@ class MainApp(QMainWindow):
             logger.info("Auto-save enabled", interval=app_settings.auto_save_interval)
         
         # --- Load Last Opened File ---
+        self._project_load_signals = _ProjectLoadSignals(self)
+        self._project_load_signals.finished.connect(self._on_project_loaded)
         self.load_last_project()
 
+    def _tab_icon(self, path, name):
+        """Load a pre-rendered tab icon, falling back to qtawesome if it is missing."""
+        if path.exists():
+            return QIcon(str(path))
+        return styles.cached_icon(name, styles.COLORS["brand_primary"])
+
+    def _install_tab_icons(self):
+        """Add icons to tabs (using brand color)."""
+        self.tabs.setTabIcon(0, self._tab_icon(TAB_ICON_MANAGER, 'fa5s.table'))
+        self.tabs.setTabIcon(1, self._tab_icon(TAB_ICON_SCANNER, 'fa5s.robot'))
+
+    def _ensure_scanner(self):
+        """Build the Scanner tab the first time it is opened."""
+        if self.scanner is not None:
+            return
+        # Imported here so selenium/undetected_chromedriver/bs4 stay off the startup path
+        from tabs.scanner_tab import ScannerTab
+        self.scanner = ScannerTab()
+        self.scanner.scan_update_signal.connect(self.update_master_record)
+
+        # Swap out the placeholder without re-entering on_tab_changed
+        blocker = QSignalBlocker(self.tabs)
+        placeholder = self.tabs.widget(1)
+        self.tabs.removeTab(1)
+        self.tabs.insertTab(1, self.scanner, self._tab_icon(TAB_ICON_SCANNER, 'fa5s.robot'),
+                            "  Site Scanner")
+        self.tabs.setCurrentIndex(1)
+        blocker.unblock()
+        placeholder.deleteLater()
+
+        # Force the first sync to fill the new table
+        self._last_synced_version = -1
+
     def load_last_project(self):
-        """Automatically load the most recent project file (manual save or autosave)."""
-        import os
-        
+        """Automatically load the most recent project file (manual save or autosave).
+
+        The CSV is read on the global QThreadPool so the window comes up
+        straight away; _on_project_loaded fills the table when it's ready.
+        """
         # Get the manually saved file (if any)
         manual_file = get_last_opened_file()
         manual_time = 0
-        if manual_file and os.path.exists(manual_file):
-            manual_time = os.path.getmtime(manual_file)
+        if manual_file:
+            try:
+                manual_time = os.stat(manual_file).st_mtime
+            except OSError:
+                manual_file = ''
         
         # Get the most recent autosave (if any)
-        autosave_file = None
-        autosave_time = 0
-        autosaves = sorted(DATA_DIR.glob("autosave_*.csv"), reverse=True)
-        if autosaves:
-            autosave_file = str(autosaves[0])
-            autosave_time = os.path.getmtime(autosave_file)
+        autosave_file, autosave_time = latest_autosave()
         
         # Pick the most recent one
         if autosave_time > manual_time:
@@ -216,64 +375,71 @@ class MainApp(QMainWindow):
             last_file = None
         
         if last_file:
-            try:
-                import pandas as pd
-                self.manager.df = pd.read_csv(last_file)
-                
-                # Handle legacy CSV files with single "Provider" column
-                # Map it to "Expected Provider" and leave "Detected Provider" empty
-                if "Provider" in self.manager.df.columns and "Expected Provider" not in self.manager.df.columns:
-                    self.manager.df = self.manager.df.rename(columns={"Provider": "Expected Provider"})
-                    logger.info("Mapped legacy 'Provider' column to 'Expected Provider'")
-                
-                # Also handle case where Provider column exists alongside new columns
-                if "Provider" in self.manager.df.columns and "Expected Provider" in self.manager.df.columns:
-                    # If Expected Provider is empty but Provider has data, copy it over
-                    mask = (self.manager.df["Expected Provider"].isna() | (self.manager.df["Expected Provider"] == "")) & \
-                           (self.manager.df["Provider"].notna() & (self.manager.df["Provider"] != ""))
-                    self.manager.df.loc[mask, "Expected Provider"] = self.manager.df.loc[mask, "Provider"]
-                    logger.info("Copied Provider data to empty Expected Provider fields")
-                
-                self.manager.df = self.manager.df.reindex(columns=self.manager.columns, fill_value="")
-                self.manager.df['Status'] = self.manager.df['Status'].replace("", "PENDING").fillna('PENDING')
-                self.manager.df['Active'] = self.manager.df['Active'].replace("", "Yes").fillna('Yes')
-                self.manager.file_path = last_file
-                self.manager.populate_table()
-                self.sync_data()
-                
-                filename = os.path.basename(last_file)
-                self.status_label.setText(f"Loaded: {filename}")
-                logger.info("Loaded last project", path=last_file)
-            except Exception as e:
-                logger.warning("Could not load last project", exception=e)
-                self.status_label.setText("Ready - Could not load last project")
+            self._project_load_version = self._df_version
+            self.status_label.setText(f"Loading: {os.path.basename(last_file)}...")
+            QThreadPool.globalInstance().start(
+                _ProjectLoadJob(last_file, self.manager.columns, self._project_load_signals)
+            )
+
+    def _on_project_loaded(self, path, df):
+        """Startup project read finished (runs on the GUI thread)."""
+        if df is None:
+            self.status_label.setText("Ready - Could not load last project")
+            return
+        # Don't replace a project the user opened or started editing meanwhile
+        if self.manager.file_path is not None or self._df_version != self._project_load_version:
+            logger.info("Skipped last project, table changed while loading", path=path)
+            return
+        self.manager.df = df
+        self.manager.file_path = path
+        self.manager.populate_table()
+        # populate_table doesn't bump the version; a scanner opened while the
+        # read was running has already synced the empty table
+        self._bump_df_version()
+        self._do_sync()
+
+        self.status_label.setText(f"Loaded: {os.path.basename(path)}")
+        logger.info("Loaded last project", path=path)
 
     def auto_save(self):
-        """Auto-save current state."""
+        """Auto-save current state.
+
+        The snapshot is taken on the GUI thread; the CSV write runs on the
+        global QThreadPool so large projects don't freeze the UI.
+        """
+        if self._autosave_inflight:
+            logger.debug("Auto-save skipped, previous write still running")
+            return
+        self._flush_updates()
+        if not self._dirty:
+            return
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime(AUTOSAVE_STAMP_FORMAT)
             auto_save_path = DATA_DIR / f"autosave_{timestamp}.csv"
             df = self.manager.get_dataframe()
             if df is not None and not df.empty:
-                df.to_csv(auto_save_path, index=False)
-                logger.info("Auto-save completed", path=str(auto_save_path))
-                
-                # Clean up old auto-saves (keep only last 5)
-                self.cleanup_old_autosaves()
+                self._autosave_inflight = True
+                self._dirty = False
+                QThreadPool.globalInstance().start(
+                    _AutosaveJob(df, auto_save_path, self._autosave_signals)
+                )
         except Exception as e:
+            self._autosave_inflight = False
             logger.error("Auto-save failed", exception=e)
 
-    def cleanup_old_autosaves(self):
-        """Keep only the 5 most recent auto-saves."""
-        try:
-            autosaves = sorted(DATA_DIR.glob("autosave_*.csv"), reverse=True)
-            for old_file in autosaves[5:]:
-                old_file.unlink()
-        except Exception as e:
-            logger.warning("Could not cleanup old autosaves", exception=e)
+    def _on_autosave_finished(self, path, ok):
+        """Auto-save write finished (runs on the GUI thread)."""
+        self._autosave_inflight = False
+        if ok:
+            self.status_label.setText(f"Auto-saved: {os.path.basename(path)}")
+        else:
+            # Retry on the next tick
+            self._dirty = True
+            self.status_label.setText("Auto-save failed")
 
     def trigger_save(self):
         """Save the current project."""
+        self._flush_updates()
         self.manager.save_csv()
         
         # Remember this file for next launch
@@ -285,59 +451,72 @@ class MainApp(QMainWindow):
     def on_tab_changed(self, index):
         """Handle tab switching."""
         if index == 1:  # Scanner tab
+            self._ensure_scanner()
             self.manager.table.setSortingEnabled(False)
-            self.sync_data()
+            self._do_sync()
             self.status_label.setText(" Scanner Mode: Ready to scan")
         else:  # Manager tab
             self.manager.table.setSortingEnabled(True)
             self.status_label.setText(" Manager Mode: Edit your client list")
 
+    def _mark_dirty(self):
+        """Flag unsaved manager changes for the next auto-save."""
+        self._dirty = True
+
+    def _bump_df_version(self):
+        """Mark the manager data as changed since the last sync."""
+        self._df_version += 1
+
     def sync_data(self):
+        """Schedule a Manager -> Scanner sync; restarting the timer coalesces bursts."""
+        self._sync_timer.start()
+
+    def _do_sync(self):
         """Sync data from Manager to Scanner."""
-        df = self.manager.get_dataframe()
-        self.scanner.load_from_dataframe(df)
-        count = len(df) if df is not None else 0
-        self.status_label.setText(f"Synced {count} records")
+        self._sync_timer.stop()
+        if self._df_version == self._last_synced_version:
+            return
+
+        model = self.manager.model
+        rows, structure_changed = model.take_changes()
+        if self.scanner is not None:
+            first_sync = self._last_synced_version == -1
+            self._last_synced_version = self._df_version
+            # Small in-place edits are patched; anything that moves rows reloads
+            if (not first_sync and not structure_changed
+                    and len(rows) <= model.rowCount() // 4
+                    and self.scanner.apply_patch(model.row_records(rows))):
+                self.status_label.setText(f"Synced {len(rows)} changed records")
+            else:
+                self.scanner.load_from_dataframe(self.manager.get_dataframe())
+                self.status_label.setText(f"Synced {model.rowCount()} records")
+        else:
+            self.status_label.setText(f"Synced {model.rowCount()} records")
         self.update_client_count()
 
     def update_client_count(self):
         """Update the active clients count in the status bar."""
-        active_count = 0
-        for row in range(self.manager.table.rowCount()):
-            active_item = self.manager.table.item(row, 9)  # Active column
-            if active_item and active_item.text() == "Yes":
-                active_count += 1
+        active_count = int(np.count_nonzero(self.manager.model.column_values(9) == "Yes"))
         self.client_count_label.setText(f"Active Clients: {active_count} ")
 
     def update_master_record(self, original_idx, status, msg, vendor, config):
-        """Update the Manager table when Scanner finds a result."""
+        """Queue a Scanner result for the Manager table."""
+        self._pending_updates.append((original_idx, status, msg, vendor, config))
+        self._dirty = True
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_updates(self):
+        """Apply all queued Scanner results to the Manager table in one pass."""
+        if not self._pending_updates:
+            return
+        pending, self._pending_updates = self._pending_updates, []
         try:
-            # Update Detected Provider (column 3)
-            provider_item = self.manager.table.item(original_idx, 3)
-            if provider_item:
-                provider_item.setText(vendor if vendor else "")
-                
-            # Update Config (column 4)
-            config_item = self.manager.table.item(original_idx, 4)
-            if config_item and config:
-                config_item.setText(config)
-
-            # Update Status (column 5)
-            status_item = self.manager.table.item(original_idx, 5)
-            if status_item:
-                status_item.setText(status)
-            
-            # Update Details (column 6)
-            details_item = self.manager.table.item(original_idx, 6)
-            if details_item:
-                details_item.setText(msg)
-            
-            # Refresh row styling
-            self.manager.update_row_style(original_idx)
-            
-            self.status_label.setText(f"Updated: {status}")
+            self.manager.apply_scan_results(pending)
         except Exception as e:
-            logger.error("Failed to update master record", exception=e, row=original_idx)
+            logger.error("Failed to update master records", exception=e, count=len(pending))
+
+        self.status_label.setText(f"Updated: {pending[-1][1]}")
 
     def create_backup(self):
         """Create database backup."""
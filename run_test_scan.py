@@ -8,15 +8,34 @@ Usage:
 
 import sys
 import os
+import re
+import argparse
+import asyncio
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 import pandas as pd
 from datetime import datetime
 import time
-from PyQt6.QtCore import QEventLoop
 
-# Make sure we can import from tabs
+# Make sure we can import scan_engine
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from tabs.scanner_tab import BatchWorker, needs_session_warming
+# scan_engine has no Qt dependency, so this script runs without PyQt
+from scan_engine import (PROBLEMATIC_SITES_RE, HTTP_MAX_ATTEMPTS, make_http_session,
+                         http_get, should_retry, retry_delay, evaluate_http_response,
+                         http_error_result, scan_in_browser)
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
 
 # ============================================================================
 # CONFIGURATION
@@ -25,6 +44,24 @@ from tabs.scanner_tab import BatchWorker, needs_session_warming
 CSV_FILE = "Test_Data_Sites_-_scan_report_2026-01-28_18-1.csv"
 OUTPUT_FILE = f"test_scan_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 MAX_SITES_TO_SCAN = 5  # Change to None to scan all
+MIN_HOST_INTERVAL = 1.0  # Seconds between HTTP requests to the same host
+
+# Host part of a URL, with any scheme and leading "www." dropped
+_HOST_RE = re.compile(r'^(?:https?://)?(?:www\.)?([^/]+)')
+
+# Most sockets the HTTP tier may hold open at once
+MAX_OPEN_SOCKETS = 500
+
+# Results are written into the table in batches of this size
+RESULT_BATCH_SIZE = 32
+
+# Scan result keys -> report columns
+RESULT_COLUMNS = {'status': 'Status', 'vendor': 'Provider', 'config': 'Config', 'msg': 'Details'}
+
+parser = argparse.ArgumentParser(description="Run a test scan over CSV_FILE")
+parser.add_argument("--workers", type=int, default=100,
+                    help="HTTP checks to run concurrently (default: 100)")
+args = parser.parse_args()
 
 print("""
 ======================================================================
@@ -44,20 +81,17 @@ All Improvements Active:
 print(f"Loading test data from: {CSV_FILE}")
 
 try:
-    df = pd.read_csv(CSV_FILE)
+    # Every column is text; read it as strings so blank cells stay '' and
+    # the pyarrow parser can build the frame without object columns
+    df = pd.read_csv(CSV_FILE, dtype=str, keep_default_na=False,
+                     engine='pyarrow' if pacsv is not None else 'c')
     print(f"✓ Loaded {len(df)} sites")
     
     # Add required columns if missing
-    if 'Provider' not in df.columns:
-        df['Provider'] = ''
-    if 'Config' not in df.columns:
-        df['Config'] = ''
-    if 'Status' not in df.columns:
-        df['Status'] = 'PENDING'
-    if 'Details' not in df.columns:
-        df['Details'] = ''
-    if 'Active' not in df.columns:
-        df['Active'] = 'Yes'
+    for col, default in (('Provider', ''), ('Config', ''), ('Status', 'PENDING'),
+                         ('Details', ''), ('Active', 'Yes')):
+        if col not in df.columns:
+            df[col] = default
     
 except FileNotFoundError:
     print(f"✗ Error: Could not find file: {CSV_FILE}")
@@ -76,16 +110,14 @@ if MAX_SITES_TO_SCAN:
 # PREPARE BATCH
 # ============================================================================
 
-batch_data = []
-for idx, row in df.iterrows():
-    client_name = row['Client Name']
-    url = row['URL']
-    
-    # Add https:// if not present
-    if not url.startswith('http://') and not url.startswith('https://'):
-        url = 'https://' + url
-    
-    batch_data.append((idx, client_name, url, idx))
+# Add https:// where the URL has no scheme, once for the whole column, so
+# everything downstream (and the report) sees full URLs
+has_scheme = df['URL'].str.startswith(('http://', 'https://'))
+df['URL'] = df['URL'].where(has_scheme, 'https://' + df['URL'])
+
+# (row, client, url, original index, expected provider) as scan_in_browser unpacks it
+rows = df.index.tolist()
+batch_data = list(zip(rows, df['Client Name'].tolist(), df['URL'].tolist(), rows, [''] * len(rows)))
 
 # ============================================================================
 # PRE-SCAN ANALYSIS
@@ -97,13 +129,10 @@ print("=" * 70)
 
 print(f"\nTotal sites to scan: {len(batch_data)}")
 
-# Check warming needs
-warming_count = 0
-warming_sites = []
-for _, client, url, _ in batch_data:
-    if needs_session_warming(url):
-        warming_count += 1
-        warming_sites.append(client)
+# Check warming needs (same patterns as needs_session_warming, over the whole column)
+warming_mask = df['URL'].astype(str).str.lower().str.contains(PROBLEMATIC_SITES_RE, na=False)
+warming_count = int(warming_mask.sum())
+warming_sites = df.loc[warming_mask, 'Client Name'].tolist()
 
 print(f"\nSession warming analysis:")
 print(f"  Sites requiring warming: {warming_count} ({warming_count/len(batch_data)*100:.1f}%)")
@@ -146,47 +175,135 @@ print("  • [DIRECT] vs [WARM] indicators")
 print("  • Variable delays between scans")
 print("\n" + "-" * 70 + "\n")
 
-# Track results
-scan_results = {}
+# Track results (merged into df every RESULT_BATCH_SIZE results)
+pending_results = {}
+completed_count = 0
+batch_sites = {row_idx: (client, url) for row_idx, client, url, *_ in batch_data}
 scan_start_time = time.time()
 
-# Create worker
-worker = BatchWorker(batch_data)
+# Each result is also appended to OUTPUT_FILE as it arrives, so a crash mid-scan
+# keeps everything finished so far; the full report replaces it at the end
+results_file = open(OUTPUT_FILE, 'w', newline='', encoding='utf-8')
+results_writer = csv.DictWriter(results_file, fieldnames=['Client Name', 'URL', *RESULT_COLUMNS.values()])
+results_writer.writeheader()
+
+# Result callbacks (shared by the HTTP tier and the browser scan, both on this thread)
+def commit_results():
+    """Write the buffered results into df in one update"""
+    if not pending_results:
+        return
+    results_df = (pd.DataFrame.from_dict(pending_results, orient='index')
+                  .reindex(columns=list(RESULT_COLUMNS))
+                  .rename(columns=RESULT_COLUMNS)
+                  .fillna(''))
+    df.update(results_df)
+    pending_results.clear()
 
-# Connect signals with FIXED logic
 def on_result(row_idx, result):
     """Called when each scan completes"""
-    scan_results[row_idx] = result
+    global completed_count
+    client, url = batch_sites[row_idx]
     
-    # Update dataframe directly by row index
-    df.at[row_idx, 'Status'] = result['status']
-    df.at[row_idx, 'Provider'] = result.get('vendor', '')
-    df.at[row_idx, 'Config'] = result.get('config', '')
-    df.at[row_idx, 'Details'] = result.get('msg', '')
+    record = {'Client Name': client, 'URL': url}
+    record.update((column, result.get(key, '')) for key, column in RESULT_COLUMNS.items())
+    results_writer.writerow(record)
+    results_file.flush()
+    
+    pending_results[row_idx] = result
+    if len(pending_results) >= RESULT_BATCH_SIZE:
+        commit_results()
+    completed_count += 1
     
     # Print progress
-    completed = len(scan_results)
     total = len(batch_data)
-    client = df.at[row_idx, 'Client Name']
-    print(f"[{completed}/{total}] {client}: {result['status']}")
+    print(f"[{completed_count}/{total}] {client}: {result['status']}")
 
 def on_finished():
     """Called when all scans complete"""
+    commit_results()
     scan_duration = time.time() - scan_start_time
     print("\n" + "-" * 70)
     print(f"✓ Scan completed in {scan_duration / 60:.1f} minutes")
 
-# Connect signals
-worker.result_signal.connect(on_result)
-worker.finished_signal.connect(on_finished)
-
-# Start scan and wait for completion
-worker.start()
-
-# Keep the main thread alive while worker runs
-loop = QEventLoop()
-worker.finished_signal.connect(loop.quit)
-loop.exec()
+def socket_budget():
+    """Cap on open sockets: half the process file-descriptor limit, at most MAX_OPEN_SOCKETS."""
+    if resource is None:
+        return MAX_OPEN_SOCKETS
+    soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    if soft_limit == resource.RLIM_INFINITY:
+        return MAX_OPEN_SOCKETS
+    return max(1, min(MAX_OPEN_SOCKETS, soft_limit // 2))
+
+async def scan_all(batch, workers):
+    """Run the HTTP tier for every site concurrently.
+
+    Conclusive results are recorded straight away; returns the items that
+    still need a browser scan.
+    """
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(workers)
+    # Separate from --workers so a high worker count can't run the process
+    # out of file descriptors
+    fd_sem = asyncio.BoundedSemaphore(socket_budget())
+    # Fetches wait on the network; parsing/rule checks are CPU work, so
+    # they get their own small pool and never hold up a network slot
+    io_pool = ThreadPoolExecutor(max_workers=workers)
+    cpu_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    session = make_http_session(pool_size=workers)
+
+    # Per-host pacing so sites sharing a host aren't hit in a burst: each
+    # request reserves the host's next send time up front
+    last_request = {}
+
+    def reserve_host_slot(host, not_before):
+        """Claim a send time for host at least MIN_HOST_INTERVAL after the last one."""
+        slot = max(not_before, last_request.get(host, float('-inf')) + MIN_HOST_INTERVAL)
+        last_request[host] = slot
+        return slot
+
+    async def scan_one(item):
+        url = item[2]
+        host = urlsplit(url).netloc.lower()
+        not_before = loop.time()
+        try:
+            for attempt in range(HTTP_MAX_ATTEMPTS):
+                # Wait for our turn on this host before taking a worker or
+                # socket slot, so a busy host doesn't stall the others
+                await asyncio.sleep(max(0.0, reserve_host_slot(host, not_before) - loop.time()))
+                async with sem, fd_sem:
+                    response = await loop.run_in_executor(io_pool, http_get, url, session)
+                if not should_retry(response, attempt):
+                    break
+                # 429/503 backoff: the retry's slot comes after the delay, which
+                # also holds back the host's later requests
+                not_before = loop.time() + retry_delay(response, attempt)
+            result = await loop.run_in_executor(cpu_pool, evaluate_http_response, response)
+        except Exception as e:
+            result = http_error_result(e)
+        if result is None:
+            return item
+        on_result(item[0], result)
+        return None
+
+    try:
+        pending = await asyncio.gather(*(scan_one(item) for item in batch))
+    finally:
+        io_pool.shutdown()
+        cpu_pool.shutdown()
+        session.close()
+    return [item for item in pending if item is not None]
+
+# Tier 1: every site over HTTP at once
+print(f"HTTP checks ({args.workers} at a time)...")
+browser_batch = asyncio.run(scan_all(batch_data, args.workers))
+
+# Tier 2: only the sites HTTP couldn't settle go through the browser
+if browser_batch:
+    print(f"\n{len(browser_batch)} site(s) need a browser scan")
+    scan_in_browser(browser_batch, on_result)
+
+on_finished()
+results_file.close()
 
 scan_duration = time.time() - scan_start_time
 
@@ -198,8 +315,9 @@ print("\n" + "=" * 70)
 print("SCAN RESULTS SUMMARY")
 print("=" * 70)
 
-# Count by status
-status_counts = df['Status'].value_counts()
+# Count by status (one pass over the column; the counts and masks below are reused)
+status_col = df['Status']
+status_counts = status_col.value_counts()
 total = len(df)
 
 print(f"\nTotal sites scanned: {total}")
@@ -207,13 +325,13 @@ print(f"Scan duration: {scan_duration / 60:.1f} minutes")
 print(f"Average time per site: {scan_duration / total:.1f} seconds")
 
 print("\nResults by status:")
-for status in ['PASS', 'WARN', 'FAIL', 'BLOCKED', 'ERROR']:
-    count = status_counts.get(status, 0)
+summary_counts = status_counts.reindex(['PASS', 'WARN', 'FAIL', 'BLOCKED', 'ERROR'], fill_value=0)
+for status, count in summary_counts.items():
     percentage = (count / total * 100) if total > 0 else 0
     print(f"  {status:8s}: {count:3d} ({percentage:5.1f}%)")
 
 # Success rate
-success_count = status_counts.get('PASS', 0) + status_counts.get('WARN', 0)
+success_count = int(summary_counts['PASS'] + summary_counts['WARN'])
 success_rate = (success_count / total * 100) if total > 0 else 0
 
 print(f"\n{'='*70}")
@@ -222,7 +340,7 @@ print(f"{'='*70}")
 
 # Vendor breakdown
 print("\nVendor detection:")
-vendor_counts = df[df['Provider'] != '']['Provider'].value_counts()
+vendor_counts = df['Provider'].value_counts().drop('', errors='ignore')
 if not vendor_counts.empty:
     for vendor, count in vendor_counts.head(5).items():
         print(f"  {vendor}: {count}")
@@ -231,7 +349,7 @@ else:
 
 # Config types
 print("\nConfiguration types detected:")
-config_counts = df[df['Config'] != '']['Config'].value_counts()
+config_counts = df['Config'].value_counts().drop('', errors='ignore')
 if not config_counts.empty:
     for config, count in config_counts.items():
         print(f"  {config}: {count}")
@@ -239,33 +357,39 @@ else:
     print("  No configurations detected")
 
 # Problem sites
-blocked = df[df['Status'] == 'BLOCKED']
-if not blocked.empty:
+if summary_counts['BLOCKED']:
+    blocked = df.loc[status_col.eq('BLOCKED'), ['Client Name', 'URL']]
     print(f"\n⚠️  BLOCKED sites ({len(blocked)}):")
-    for _, row in blocked.iterrows():
-        print(f"  • {row['Client Name']} - {row['URL']}")
+    for client, url in blocked[['Client Name', 'URL']].itertuples(index=False):
+        print(f"  • {client} - {url}")
     print("\n  💡 Consider adding these domains to PROBLEMATIC_SITES list:")
     # Extract unique domains
-    blocked_domains = set()
-    for url in blocked['URL']:
-        # Extract domain
-        domain = url.replace('https://', '').replace('http://', '').replace('www.', '').split('/')[0]
-        blocked_domains.add(domain)
+    blocked_domains = blocked['URL'].astype(str).str.extract(_HOST_RE)[0].dropna().unique()
     for domain in blocked_domains:
         print(f"     '{domain}',")
 
-failed = df[df['Status'] == 'FAIL']
-if not failed.empty:
+if summary_counts['FAIL']:
+    failed = df.loc[status_col.eq('FAIL'), ['Client Name', 'Details']]
     print(f"\n⚠️  FAILED sites ({len(failed)}):")
-    for _, row in failed.head(3).iterrows():
-        print(f"  • {row['Client Name']}: {row['Details']}")
+    for client, details in failed[['Client Name', 'Details']].head(3).itertuples(index=False):
+        print(f"  • {client}: {details}")
 
 # ============================================================================
 # SAVE RESULTS
 # ============================================================================
 
+def write_report(frame, path):
+    """Write the report with pyarrow's multi-threaded C++ writer when installed."""
+    if pacsv is not None:
+        try:
+            pacsv.write_csv(pa.Table.from_pandas(frame, preserve_index=False), path)
+            return
+        except pa.ArrowException:
+            pass  # Mixed-type column Arrow can't convert - use pandas
+    frame.to_csv(path, index=False)
+
 try:
-    df.to_csv(OUTPUT_FILE, index=False)
+    write_report(df, OUTPUT_FILE)
     print(f"\n✓ Results saved to: {OUTPUT_FILE}")
 except Exception as e:
     print(f"\n✗ Error saving results: {e}")
@@ -15,7 +15,8 @@ import time
 # Make sure we can import from tabs
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from tabs.scanner_tab import BatchWorker, needs_session_warming
+from tabs.scanner_tab import BatchWorker
+from scan_engine import needs_session_warming
 
 # ============================================================================
 # CONFIGURATION
@@ -0,0 +1,1076 @@
+# scan_engine.py
+# Scan Engine - Site checks shared by the Scanner tab and the headless test scan
+# Part of MyOffer Monitor
+#
+# Nothing here imports Qt, so scripts can run scans without a GUI.
+
+import os
+import re
+import time
+import random
+import json
+import requests
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Dict, List, Set
+import undetected_chromedriver as uc
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config import VENDOR_DETECTION_RULES, BLOCK_DETECTION_PHRASES
+from logger import get_logger, LogExecutionTime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+logger = get_logger(__name__)
+
+# ============================================================================
+# BLOCK TRACKER - Manages UNVERIFIABLE status
+# ============================================================================
+
+class BlockTracker:
+    """
+    Tracks blocked sites and determines when they should be marked UNVERIFIABLE.
+    Persists data to JSON so it survives app restarts.
+    """
+    
+    BLOCK_THRESHOLD = 3  # Consecutive blocks before UNVERIFIABLE
+    HISTORY_DAYS = 7     # Only count blocks within this window
+    SAVE_INTERVAL = 5    # Seconds between history writes during a scan; flush() writes the rest
+    
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = data_dir
+        self.history_file = os.path.join(data_dir, "block_history.json")
+        self.block_history: Dict[str, List[str]] = {}
+        self.known_unverifiable: Set[str] = set()
+        self._dirty = False
+        self._last_save = float("-inf")
+        self._load()
+    
+    def _get_domain(self, url: str) -> str:
+        """Extract clean domain from URL."""
+        try:
+            from urllib.parse import urlparse
+            parsed = urlparse(url)
+            domain = parsed.netloc.lower()
+            if domain.startswith('www.'):
+                domain = domain[4:]
+            return domain
+        except:
+            return url.lower()
+    
+    def _load(self):
+        """Load block history from disk."""
+        try:
+            if os.path.exists(self.history_file):
+                with open(self.history_file, 'rb') as f:
+                    raw = f.read()
+                    data = orjson.loads(raw) if orjson else json.loads(raw)
+                    self.block_history = data.get('history', {})
+                    self.known_unverifiable = set(data.get('unverifiable', []))
+                    if self.known_unverifiable:
+                        print(f"📋 Loaded {len(self.known_unverifiable)} unverifiable sites from history")
+        except Exception as e:
+            print(f"Warning: Could not load block history: {e}")
+            self.block_history = {}
+            self.known_unverifiable = set()
+    
+    def _mark_changed(self):
+        """Note a change made during a scan; written at most once per SAVE_INTERVAL."""
+        self._dirty = True
+        if time.monotonic() - self._last_save >= self.SAVE_INTERVAL:
+            self._save()
+    
+    def flush(self):
+        """Write any changes not yet saved (call when a scan ends)."""
+        if self._dirty:
+            self._save()
+    
+    def _save(self):
+        """Save block history to disk."""
+        self._dirty = False
+        self._last_save = time.monotonic()
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+            data = {
+                'history': self.block_history,
+                'unverifiable': sorted(list(self.known_unverifiable)),
+                'last_updated': datetime.now().isoformat()
+            }
+            if orjson:
+                with open(self.history_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.history_file, 'w') as f:
+                    json.dump(data, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save block history: {e}")
+    
+    def is_unverifiable(self, url: str) -> bool:
+        """Check if a site is marked as unverifiable."""
+        domain = self._get_domain(url)
+        return domain in self.known_unverifiable
+    
+    def get_block_count(self, url: str) -> int:
+        """Get the current block count for a site."""
+        domain = self._get_domain(url)
+        if domain not in self.block_history:
+            return 0
+        cutoff = (datetime.now() - timedelta(days=self.HISTORY_DAYS)).isoformat()
+        recent = [t for t in self.block_history[domain] if t > cutoff]
+        return len(recent)
+    
+    def record_block(self, url: str) -> tuple:
+        """
+        Record a block event. 
+        Returns: (consecutive_count, is_now_unverifiable)
+        """
+        domain = self._get_domain(url)
+        now = datetime.now()
+        
+        if domain not in self.block_history:
+            self.block_history[domain] = []
+        
+        cutoff = (now - timedelta(days=self.HISTORY_DAYS)).isoformat()
+        self.block_history[domain] = [
+            t for t in self.block_history[domain] if t > cutoff
+        ]
+        
+        self.block_history[domain].append(now.isoformat())
+        consecutive = len(self.block_history[domain])
+        is_unverifiable = consecutive >= self.BLOCK_THRESHOLD
+        
+        if is_unverifiable and domain not in self.known_unverifiable:
+            self.known_unverifiable.add(domain)
+            print(f"⚠️  {domain} marked UNVERIFIABLE after {consecutive} blocks")
+        
+        self._mark_changed()
+        return consecutive, is_unverifiable
+    
+    def record_success(self, url: str):
+        """Record a successful scan - clears block history for domain."""
+        domain = self._get_domain(url)
+        changed = False
+        
+        if domain in self.block_history:
+            del self.block_history[domain]
+            changed = True
+        
+        if domain in self.known_unverifiable:
+            self.known_unverifiable.remove(domain)
+            print(f"✓ {domain} removed from UNVERIFIABLE (successful scan)")
+            changed = True
+        
+        if changed:
+            self._mark_changed()
+    
+    def reset_site(self, url: str):
+        """Reset a site's unverifiable status for re-testing."""
+        domain = self._get_domain(url)
+        changed = False
+        
+        if domain in self.known_unverifiable:
+            self.known_unverifiable.remove(domain)
+            changed = True
+        
+        if domain in self.block_history:
+            del self.block_history[domain]
+            changed = True
+        
+        if changed:
+            print(f"↻ {domain} reset for re-scanning")
+            self._save()
+    
+    def get_unverifiable_domains(self) -> List[str]:
+        """Get list of all unverifiable domains."""
+        return sorted(list(self.known_unverifiable))
+
+
+# ============================================================================
+# QUICK HTTP CHECK - Tier 1 scanning (no browser needed)
+# ============================================================================
+
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+# Bot-protection markers in a raw HTTP response; any hit defers to the browser
+HTTP_BOT_PHRASES = (
+    'checking your browser',
+    'please enable javascript',
+    'captcha',
+    'access denied',
+    'bot detected',
+    'security check',
+    'please wait while we verify',
+    'ray id',
+    'cf-browser-verification',
+    'challenge-platform',
+    'ddos protection',
+    'pardon our interruption',
+    'just a moment',
+    'attention required',
+)
+
+
+def make_http_session(pool_size: int = 10) -> requests.Session:
+    """Session shared by the HTTP tier so connections are pooled across URLs.
+
+    Raise pool_size when the session is used from that many threads at once.
+    """
+    session = requests.Session()
+    session.headers.update(HTTP_HEADERS)
+    if pool_size > 10:
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    return session
+
+
+# Rate limited / temporarily unavailable: back off and retry before giving up
+HTTP_RETRY_STATUSES = frozenset({429, 503})
+HTTP_MAX_ATTEMPTS = 3
+HTTP_MAX_RETRY_DELAY = 30
+
+
+def retry_delay(response, attempt: int) -> float:
+    """Seconds to wait before retrying: the server's Retry-After, else 2**attempt plus jitter."""
+    retry_after = response.headers.get('Retry-After', '').strip()
+    if retry_after.isdigit():
+        return min(int(retry_after), HTTP_MAX_RETRY_DELAY)
+    return 2 ** attempt + random.uniform(0, 1)
+
+
+def http_get(url: str, session: Optional[requests.Session] = None) -> requests.Response:
+    """Single Tier 1 GET, no retries."""
+    if session is not None:
+        return session.get(url, timeout=10, allow_redirects=True)
+    return requests.get(url, headers=HTTP_HEADERS, timeout=10, allow_redirects=True)
+
+
+def should_retry(response: requests.Response, attempt: int) -> bool:
+    """True when a 429/503 response has attempts left."""
+    return response.status_code in HTTP_RETRY_STATUSES and attempt < HTTP_MAX_ATTEMPTS - 1
+
+
+def fetch_http(url: str, session: Optional[requests.Session] = None) -> requests.Response:
+    """
+    Tier 1, network half: GET the page, backing off on 429/503.
+    
+    Blocking; async callers run their own loop over http_get so the backoff
+    doesn't hold a worker thread. Request errors are raised; map them with
+    http_error_result.
+    """
+    for attempt in range(HTTP_MAX_ATTEMPTS):
+        response = http_get(url, session)
+        if not should_retry(response, attempt):
+            break
+        time.sleep(retry_delay(response, attempt))
+    return response
+
+
+def evaluate_http_response(response: requests.Response) -> Optional[dict]:
+    """
+    Tier 1, parsing half: check the raw HTML of a fetched page.
+    
+    When the script marker is in the server-rendered HTML, the page goes
+    through the same rules as the browser scan (evaluate_page).
+    
+    Returns:
+        - dict with status info if conclusive
+        - None if inconclusive (needs browser check)
+    """
+    if response.status_code == 403:
+        return None  # Blocked - need browser
+    
+    if response.status_code in HTTP_RETRY_STATUSES:
+        return None  # Still rate limited / unavailable - let the browser try
+    
+    if response.status_code >= 400:
+        return {
+            'status': 'FAIL',
+            'vendor': 'HTTP Error',
+            'config': 'ERR',
+            'msg': f'Status code: {response.status_code}',
+            'method': 'http_quick'
+        }
+    
+    html = response.text
+    html_lower = html.lower()
+    
+    # Check for bot detection
+    for phrase in HTTP_BOT_PHRASES:
+        if phrase in html_lower:
+            return None  # Bot detection present - need browser
+    
+    # Script is server-rendered: apply the full rules without a browser.
+    # Anything short of a PASS is rechecked in the browser, since more
+    # tags may be injected client-side.
+    if BASE_TARGET in html_lower:
+        status, msg, config, vendor = evaluate_page(html, html_lower)
+        if status == 'PASS':
+            return {
+                'status': status,
+                'vendor': vendor,
+                'config': config,
+                'msg': f'{msg} (HTTP)',
+                'method': 'http_quick'
+            }
+    
+    # Script not found - might be loaded via JS, need browser
+    return None
+
+
+def http_error_result(error: Exception) -> Optional[dict]:
+    """
+    Map an error from the HTTP tier to a definite FAIL, or None when the
+    browser should try instead.
+    """
+    if isinstance(error, requests.Timeout):
+        # Timeout could mean slow site or protection - try browser
+        return None
+    if isinstance(error, requests.exceptions.SSLError):
+        return {
+            'status': 'FAIL',
+            'vendor': 'SSL Error',
+            'config': 'ERR',
+            'msg': 'SSL certificate verification failed',
+            'method': 'http_quick'
+        }
+    if isinstance(error, requests.exceptions.ConnectionError):
+        error_str = str(error).lower()
+        # DNS failures and connection refused are definite FAILs
+        if 'name or service not known' in error_str or 'getaddrinfo failed' in error_str:
+            return {
+                'status': 'FAIL',
+                'vendor': 'DNS Error',
+                'config': 'ERR',
+                'msg': 'Domain does not resolve',
+                'method': 'http_quick'
+            }
+        if 'connection refused' in error_str:
+            return {
+                'status': 'FAIL',
+                'vendor': 'Connection Refused',
+                'config': 'ERR',
+                'msg': 'Server refused connection',
+                'method': 'http_quick'
+            }
+        if 'no route to host' in error_str or 'network is unreachable' in error_str:
+            return {
+                'status': 'FAIL',
+                'vendor': 'Network Error',
+                'config': 'ERR',
+                'msg': 'Site unreachable',
+                'method': 'http_quick'
+            }
+        return None  # Other connection errors - try browser
+    return None
+
+
+def quick_http_check(url: str, session: Optional[requests.Session] = None) -> Optional[dict]:
+    """
+    Tier 1: Quick HTTP request to check for script in raw HTML.
+    
+    Returns:
+        - dict with status info if conclusive
+        - None if inconclusive (needs browser check)
+    """
+    try:
+        return evaluate_http_response(fetch_http(url, session))
+    except Exception as e:
+        return http_error_result(e)
+
+
+# ============================================================================
+# SITES THAT REQUIRE SESSION WARMING
+# ============================================================================
+
+PROBLEMATIC_SITES = [
+    # Security providers
+    'cloudflare',
+    'imperva',
+    'incapsula',
+    'perimeter',
+    'distil',
+    
+    # High-volume dealer groups
+    'lithia.com',
+    'autonation.com',
+    'carmax.com',
+    'penske',
+    'asbury',
+    
+    # Specific vendors known for strict security
+    'dealer.com',
+    'dealertrack',
+    'audinorthlake.com',
+    'audisouthaustin.com',
+    'audiusa',
+]
+
+# All patterns as one alternation, for matching whole URL columns at once
+PROBLEMATIC_SITES_RE = re.compile("|".join(re.escape(pattern) for pattern in PROBLEMATIC_SITES))
+
+
+def needs_session_warming(url):
+    """Check if a URL needs session warming based on known problematic patterns."""
+    return PROBLEMATIC_SITES_RE.search(url.lower()) is not None
+
+
+def warm_up_session(driver, target_url):
+    """
+    Visits the homepage before going to the target page.
+    This makes the visit look more natural and less bot-like.
+    """
+    from urllib.parse import urlparse
+    
+    try:
+        parsed = urlparse(target_url)
+        homepage = f"{parsed.scheme}://{parsed.netloc}"
+        
+        print(f"    → Warming session: visiting {homepage}")
+        driver.get(homepage)
+        delay = random.uniform(4, 8)
+        time.sleep(delay)
+        
+        try:
+            driver.execute_script("window.scrollTo(0, 500);")
+            time.sleep(0.5)
+        except:
+            pass
+        
+        print(f"    → Session warmed, now visiting target page")
+        
+    except Exception as e:
+        print(f"    ⚠ Session warming failed (continuing anyway): {e}")
+
+
+def save_evidence_screenshot(driver, client_name, status):
+    """Takes a screenshot of the current browser state."""
+    try:
+        today = datetime.now().strftime("%Y-%m-%d")
+        base_folder = os.path.join(os.getcwd(), "scans", today)
+        if not os.path.exists(base_folder):
+            os.makedirs(base_folder)
+
+        safe_name = re.sub(r'[\\/*?:"<>|]', "", client_name)
+        safe_name = safe_name.replace(" ", "_")
+        
+        filename = f"{status}_{safe_name}.png"
+        full_path = os.path.join(base_folder, filename)
+        
+        driver.save_screenshot(full_path)
+        return True
+    except Exception as e:
+        logger.error("Screenshot failed", exception=e, client=client_name)
+        return False
+
+
+# Vendor markers in priority order, taken from config.VENDOR_DETECTION_RULES.
+# detect_provider has always reported Sokal in title case.
+_PROVIDER_LABELS = {"SOKAL": "Sokal"}
+_PROVIDER_RULES = [
+    (_PROVIDER_LABELS.get(vendor, vendor), [(source, marker.lower()) for source, marker in rules])
+    for vendor, rules in VENDOR_DETECTION_RULES.items()
+]
+
+
+def _build_provider_automata():
+    """One Aho-Corasick automaton per haystack ("html"/"text"), valued by rule priority."""
+    automata = {}
+    for source in ("html", "text"):
+        automaton = ahocorasick.Automaton()
+        for priority, (_, markers) in enumerate(_PROVIDER_RULES):
+            for marker_source, marker in markers:
+                if marker_source == source and marker not in automaton:
+                    automaton.add_word(marker, priority)
+        automaton.make_automaton()
+        automata[source] = automaton
+    return automata
+
+
+_PROVIDER_AUTOMATA = _build_provider_automata() if ahocorasick else None
+
+
+def detect_provider(html_str, text_content):
+    """Guess the site vendor from the lowercased page HTML and visible text."""
+    if _PROVIDER_AUTOMATA is not None:
+        # Single pass per haystack; the highest-priority vendor hit wins
+        best = None
+        for source, haystack in (("html", html_str), ("text", text_content)):
+            for _, priority in _PROVIDER_AUTOMATA[source].iter(haystack):
+                if best is None or priority < best:
+                    best = priority
+                    if best == 0:
+                        break
+        return _PROVIDER_RULES[best][0] if best is not None else "Other"
+
+    haystacks = {"html": html_str, "text": text_content}
+    for label, markers in _PROVIDER_RULES:
+        for source, marker in markers:
+            if marker in haystacks[source]:
+                return label
+
+    return "Other"
+
+
+_BLOCK_PHRASES = tuple(phrase.lower() for phrase in BLOCK_DETECTION_PHRASES)
+
+
+def _build_block_automaton():
+    automaton = ahocorasick.Automaton()
+    for phrase in _BLOCK_PHRASES:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+_BLOCK_AUTOMATON = _build_block_automaton() if ahocorasick else None
+
+
+def has_block_phrase(haystack):
+    """True if the lowercased text contains any bot-detection phrase."""
+    if _BLOCK_AUTOMATON is not None:
+        return next(_BLOCK_AUTOMATON.iter(haystack), None) is not None
+    return any(phrase in haystack for phrase in _BLOCK_PHRASES)
+
+
+def parse_page(page_source):
+    """Split a page into (visible text, title, head scripts, body scripts).
+
+    Text and title are lowercased; scripts are their outer HTML. Uses the
+    lexbor parser from selectolax when installed, BeautifulSoup otherwise.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(page_source)
+        title_node = tree.css_first('title')
+        title = title_node.text() if title_node is not None else ""
+        head_scripts = [node.html for node in tree.css('head script')]
+        body_scripts = [node.html for node in tree.css('body script')]
+        # Match BeautifulSoup's get_text(), which skips script and style contents
+        tree.strip_tags(['script', 'style'])
+        text = tree.root.text(separator='') if tree.root is not None else ""
+        return text.lower(), title.lower(), head_scripts, body_scripts
+
+    soup = BeautifulSoup(page_source, 'html.parser')
+    title = soup.title.string.lower() if soup.title else ""
+    head, body = soup.find('head'), soup.find('body')
+    head_scripts = [str(script) for script in head.find_all('script')] if head else []
+    body_scripts = [str(script) for script in body.find_all('script')] if body else []
+    return soup.get_text().lower(), title, head_scripts, body_scripts
+
+
+BASE_TARGET   = "idrove.it/behaviour"
+
+# behaviour.js / .spa.js / .dcom.js / .bundle.js; the group is empty for STD
+TARGET_RE = re.compile(re.escape(BASE_TARGET) + r"(?:\.(spa|dcom|bundle))?\.js")
+# A tag naming several variants counts once, as the first of these
+TARGET_PRIORITY = ("spa", "dcom", "bundle", "std")
+
+# Platforms that expect the standard script once instead of twice
+SINGLE_STD_VENDORS = frozenset({"DealerOn", "Dealer.com"})
+
+# Statuses a PENDING-only batch still picks up, and the two spellings of N/A
+PENDING_STATES = frozenset({"PENDING", ""})
+UNVERIFIABLE_STATES = frozenset({"N/A", "UNVERIFIABLE"})
+
+# Browser errors that mean the site is down (FAIL) rather than the scanner (ERROR)
+SITE_ISSUE_INDICATORS = (
+    'timeout', 'timed out',
+    'err_connection', 'connection refused',
+    'err_name_not_resolved', 'dns',
+    'net::err_', 'neterror',
+    'ssl', 'certificate',
+    'unreachable', 'no such host',
+)
+
+TARGET_PRESENT_JS = "return document.querySelector('script[src*=\"' + arguments[0] + '\"]') !== null;"
+
+
+def evaluate_page(page_source, html_str=None):
+    """Apply the script placement rules to a page.
+
+    Shared by the browser scan and the static HTML preflight. Pass html_str
+    when the caller already has the lowercased source. Returns
+    (status, msg, config, vendor).
+    """
+    if html_str is None:
+        html_str = page_source.lower()
+    text_content, title_tag, head_scripts, body_scripts = parse_page(page_source)
+
+    detected_vendor = detect_provider(html_str, text_content)
+    if not detected_vendor: detected_vendor = "Other"
+
+    # --- 1. BLOCK CHECK ---
+    is_blocked_text = has_block_phrase(text_content)
+    is_blocked_title = has_block_phrase(title_tag)
+    is_blocked_vendor = "Security Block" in detected_vendor
+
+    scan_status = "UNKNOWN"
+    scan_msg = ""
+    scan_config = "NONE"
+
+    if (is_blocked_text or is_blocked_title or is_blocked_vendor) and BASE_TARGET not in html_str:
+        scan_status = 'BLOCKED'
+        scan_msg = 'Bot Detection / CAPTCHA'
+        scan_config = 'ERR'
+        detected_vendor = "Security Block"
+    else:
+        # Standard Scan
+        counts = {
+            "std":    {"head": 0, "body": 0},
+            "dcom":   {"head": 0, "body": 0},
+            "spa":    {"head": 0, "body": 0},
+            "bundle": {"head": 0, "body": 0} 
+        }
+
+        def scan_section(scripts, name):
+            for s in scripts:
+                # Most tags never mention the script, so skip the regex for them
+                if BASE_TARGET not in s:
+                    continue
+                kinds = {kind or "std" for kind in TARGET_RE.findall(s)}
+                for kind in TARGET_PRIORITY:
+                    if kind in kinds:
+                        counts[kind][name] += 1
+                        break
+
+        scan_section(head_scripts, "head")
+        scan_section(body_scripts, "body")
+
+        total_std    = counts["std"]["head"] + counts["std"]["body"]
+        total_dcom   = counts["dcom"]["head"] + counts["dcom"]["body"]
+        total_spa    = counts["spa"]["head"] + counts["spa"]["body"]
+        total_bundle = counts["bundle"]["head"] + counts["bundle"]["body"]
+
+        # --- LOGIC RULES ---
+        if total_std == 0 and total_dcom == 0 and total_spa == 0 and total_bundle == 0:
+            scan_status, scan_msg, scan_config = 'FAIL', 'No scripts found', 'NONE'
+
+        elif total_spa > 0:
+            scan_config = 'SPA'
+            if total_spa == 4 and counts["spa"]["head"] == 0: scan_status, scan_msg = 'PASS', 'Perfect (Rule of 4)'
+            else: scan_status, scan_msg = 'WARN', f'Found {total_spa} (Expected 4)'
+
+        elif total_dcom > 0:
+            scan_config = 'DCOM'
+            if total_dcom == 1 and counts["dcom"]["head"] == 0: scan_status, scan_msg = 'PASS', 'Perfect (Rule of 1)'
+            else: scan_status, scan_msg = 'WARN', f'Found {total_dcom} (Expected 1)'
+
+        elif total_bundle > 0:
+            scan_config = 'BUNDLE'
+            if total_bundle == 2 and counts["bundle"]["head"] == 0: scan_status, scan_msg = 'PASS', 'Perfect (Rule of 2)'
+            else: scan_status, scan_msg = 'WARN', f'Found {total_bundle} (Expected 2)'
+
+        elif total_std > 0:
+            scan_config = 'STD'
+            if detected_vendor in SINGLE_STD_VENDORS:
+                if total_std == 1 and counts["std"]["head"] == 0: 
+                    scan_status, scan_msg = 'PASS', f'Perfect ({detected_vendor} Rule of 1)'
+                else: 
+                    scan_status, scan_msg = 'WARN', f'Found {total_std} ({detected_vendor} expects 1)'
+            else:
+                if total_std == 2 and counts["std"]["head"] == 0: 
+                    scan_status, scan_msg = 'PASS', 'Perfect (Rule of 2)'
+                else: 
+                    scan_status, scan_msg = 'WARN', f'Found {total_std} (Expected 2)'
+
+    return scan_status, scan_msg, scan_config, detected_vendor
+
+
+def check_url_rules(driver, url, client_name):
+    """
+    Double-Tap Logic with Updated Rules for Dealer.com
+    """
+    MAX_WAIT_TIME = 15 
+    SETTLE_TIME = 3
+    MAX_ATTEMPTS = 2
+    
+    with LogExecutionTime(logger, "url_scan", url=url, client=client_name):
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                # Check if this site needs special treatment
+                use_warming = needs_session_warming(url)
+                if use_warming:
+                    print(f"  [WARMING] {client_name} - site requires session warming")
+                    warm_up_session(driver, url)
+                else:
+                    print(f"  [DIRECT] {client_name} - direct access")
+
+                # Now load the actual target page
+                driver.get(url)
+                
+                # Poll in the browser instead of pulling page_source over the bridge
+                try:
+                    WebDriverWait(driver, MAX_WAIT_TIME).until(
+                        lambda d: d.execute_script(TARGET_PRESENT_JS, BASE_TARGET)
+                    )
+                    time.sleep(SETTLE_TIME)
+                except TimeoutException:
+                    pass
+
+                # The raw page source stands in for a re-serialized DOM
+                scan_status, scan_msg, scan_config, detected_vendor = evaluate_page(driver.page_source)
+
+                if scan_status == 'PASS':
+                    return {
+                        'status': scan_status, 
+                        'msg': scan_msg, 
+                        'config': scan_config, 
+                        'vendor': detected_vendor
+                    }
+                
+                if attempt < MAX_ATTEMPTS:
+                    print(f"Attempt {attempt} failed ({scan_status}). Retrying...")
+                    error_delay = random.uniform(3, 8)
+                    time.sleep(error_delay)
+                    continue
+                
+                save_evidence_screenshot(driver, client_name, scan_status)
+                scan_msg += " (Saved Img)"
+
+                logger.scan_result(
+                    client=client_name,
+                    url=url,
+                    status=scan_status,
+                    vendor=detected_vendor,
+                    config=scan_config,
+                    details=scan_msg
+                )
+                
+                return {
+                    'status': scan_status, 
+                    'msg': scan_msg, 
+                    'config': scan_config, 
+                    'vendor': detected_vendor
+                }
+
+            except Exception as e:
+                error_msg = str(e).lower()
+                
+                # Check if this is a "site unreachable" type error that should be FAIL, not ERROR
+                is_site_issue = any(indicator in error_msg for indicator in SITE_ISSUE_INDICATORS)
+                
+                if attempt < MAX_ATTEMPTS:
+                    error_delay = random.uniform(3, 8)
+                    time.sleep(error_delay)
+                    continue
+                
+                # If it's a site issue, return FAIL (site problem), not ERROR (scanner problem)
+                if is_site_issue:
+                    return {
+                        'status': 'FAIL', 
+                        'msg': f'Site unreachable: {str(e)[:100]}', 
+                        'config': 'ERR', 
+                        'vendor': 'Unreachable'
+                    }
+                else:
+                    return {
+                        'status': 'ERROR', 
+                        'msg': str(e)[:100], 
+                        'config': 'ERR', 
+                        'vendor': 'ERR'
+                    }
+        pass
+
+
+def reset_browser_state(driver):
+    """Clear cookies and cache so the next site sees a fresh session, without a restart."""
+    driver.delete_all_cookies()
+    driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+    driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+
+
+# ============================================================================
+# HUMAN DELAY SIMULATION
+# ============================================================================
+
+def human_delay(base_seconds=3):
+    """Simulates realistic human delay patterns."""
+    rand = random.random()
+    
+    if rand < 0.70:
+        delay = random.uniform(2.0, 5.0)
+    elif rand < 0.90:
+        delay = random.uniform(0.5, 2.0)
+    else:
+        delay = random.uniform(5.0, 15.0)
+    
+    time.sleep(delay)
+    return delay
+
+
+# ============================================================================
+# BROWSER DRIVER
+# ============================================================================
+
+def clear_chromedriver_cache():
+    """Clear cached ChromeDriver to force re-download of matching version."""
+    import shutil
+    from pathlib import Path
+
+    cache_paths = [
+        Path.home() / ".local" / "share" / "undetected_chromedriver",
+        Path.home() / "Library" / "Application Support" / "undetected_chromedriver",
+        Path.home() / "AppData" / "Roaming" / "undetected_chromedriver",
+    ]
+
+    for cache_path in cache_paths:
+        if cache_path.exists():
+            try:
+                shutil.rmtree(cache_path)
+                print(f"Cleared ChromeDriver cache: {cache_path}")
+            except Exception as e:
+                print(f"Could not clear cache {cache_path}: {e}")
+
+
+def get_chrome_version():
+    """Detect installed Chrome version."""
+    import subprocess
+    import re
+
+    commands = [
+        ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '--version'],
+        ['google-chrome', '--version'],
+        ['google-chrome-stable', '--version'],
+        ['chromium-browser', '--version'],
+        ['reg', 'query', 'HKEY_CURRENT_USER\\Software\\Google\\Chrome\\BLBeacon', '/v', 'version'],
+    ]
+
+    for cmd in commands:
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            if result.returncode == 0:
+                match = re.search(r'(\d+)\.', result.stdout)
+                if match:
+                    version = int(match.group(1))
+                    print(f"Detected Chrome version: {version}")
+                    return version
+        except:
+            continue
+
+    print("Could not detect Chrome version")
+    return None
+
+
+def start_driver(version_main=None):
+    """Creates a stealthy browser instance with randomized fingerprints."""
+    last_err = None
+
+    for attempt in range(3):
+        try: 
+            options = uc.ChromeOptions()
+
+            # Randomize User Agent
+            user_agents = [
+                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+                'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            ]
+            chosen_ua = random.choice(user_agents)
+            options.add_argument(f'--user-agent={chosen_ua}')
+
+            # Randomize Window Size
+            window_sizes = [
+                (1920, 1080),
+                (1366, 768),
+                (1440, 900),
+                (1536, 864),
+                (1280, 720),
+            ]
+            width, height = random.choice(window_sizes)
+            options.add_argument(f'--window-size={width},{height}')
+
+            # Randomize Language
+            languages = ['en-US,en', 'en-GB,en', 'en-CA,en']
+            options.add_argument(f'--accept-lang={random.choice(languages)}')
+
+            # Anti-Detection Arguments
+            options.add_argument('--disable-blink-features=AutomationControlled')
+
+            # Stability Arguments
+            options.add_argument("--disable-popup-blocking")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-notifications")
+
+            # Create Driver with specific version if provided
+            if version_main:
+                print(f"Creating driver with version_main={version_main}")
+                driver = uc.Chrome(options=options, use_subprocess=True, version_main=version_main)
+            else:
+                driver = uc.Chrome(options=options, use_subprocess=True)
+
+            # Advanced Stealth (JavaScript Injection)
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+                'source': '''
+                    Object.defineProperty(navigator, 'webdriver', {
+                        get: () => undefined
+                    });
+                    Object.defineProperty(navigator, 'plugins', {
+                        get: () => [1, 2, 3, 4, 5]
+                    });
+                    Object.defineProperty(navigator, 'languages', {
+                        get: () => ['en-US', 'en']
+                    });
+                    window.chrome = {
+                        runtime: {}
+                    };
+                    const originalQuery = window.navigator.permissions.query;
+                    window.navigator.permissions.query = (parameters) => (
+                        parameters.name === 'notifications' ?
+                            Promise.resolve({ state: Notification.permission }) :
+                            originalQuery(parameters)
+                    );
+                '''
+            })
+
+            driver.set_page_load_timeout(30)
+
+            print(f"✓ Browser started (UA: {chosen_ua[:50]}..., Size: {width}x{height})")
+            return driver
+
+        except Exception as e:
+            last_err = e
+            error_msg = str(e).lower()
+            print(f"Browser start attempt {attempt + 1} failed: {e}")
+
+            # Check for ChromeDriver version mismatch - multiple patterns
+            version_mismatch = any([
+                "chromedriver" in error_msg and "version" in error_msg,
+                "chrome version" in error_msg,
+                "only supports chrome version" in error_msg,
+                "session not created" in error_msg and "version" in error_msg,
+            ])
+
+            if version_mismatch and version_main is None:
+                print("ChromeDriver version mismatch detected!")
+                clear_chromedriver_cache()
+                # Detect Chrome version and retry with it
+                detected_version = get_chrome_version()
+                if detected_version:
+                    time.sleep(2)
+                    return start_driver(version_main=detected_version)
+
+            time.sleep(2)
+
+    raise Exception(f"Failed to start browser after 3 attempts: {last_err}")
+
+
+# ============================================================================
+# BROWSER SCAN - Tier 2 scanning (sites the HTTP check couldn't settle)
+# ============================================================================
+
+BROWSER_RESET_EVERY = 3  # Wipe cookies/cache after this many sites
+
+
+def scan_in_browser(items: list,
+                    on_result: Callable[[int, dict], None],
+                    block_tracker: Optional[BlockTracker] = None,
+                    is_running: Callable[[], bool] = lambda: True,
+                    driver_factory: Optional[Callable] = None):
+    """
+    Scan (row, client, url, original index, expected provider) items in one
+    browser, calling on_result(row_idx, result) as each site finishes.
+    
+    is_running is checked between sites so the caller can stop the scan;
+    driver_factory starts (and restarts) the browser; defaults to start_driver.
+    """
+    driver_factory = driver_factory or start_driver
+    driver = driver_factory()
+    browser_count = 0
+    
+    for item in items:
+        if not is_running():
+            break
+        
+        row_idx, client, url, original_idx, expected_provider = item
+        
+        # Wipe browser state periodically; only restart if that fails
+        if browser_count > 0 and browser_count % BROWSER_RESET_EVERY == 0:
+            try:
+                reset_browser_state(driver)
+            except WebDriverException:
+                try:
+                    driver.quit()
+                except:
+                    pass
+                time.sleep(3)
+                driver = driver_factory()
+        
+        try:
+            result = check_url_rules(driver, url, client)
+        except Exception as e:
+            try:
+                driver.quit()
+            except:
+                pass
+            driver = driver_factory()
+            result = {'status': 'ERROR', 'msg': 'Browser crashed/Recovered', 'config': 'ERR', 'vendor': 'ERR'}
+        
+        # Handle BLOCKED with escalation to UNVERIFIABLE
+        if result.get('status') == 'BLOCKED' and block_tracker:
+            count, is_unverifiable = block_tracker.record_block(url)
+            
+            if is_unverifiable:
+                result = {
+                    'status': 'UNVERIFIABLE',
+                    'vendor': 'Persistent Block',
+                    'config': 'N/A',
+                    'msg': f'Blocked {count}x. Manual verification required.'
+                }
+                print(f"  [UNVERIFIABLE] {client} - escalated after {count} blocks")
+            else:
+                result['msg'] = f"{result.get('msg', '')} ({count}/{BlockTracker.BLOCK_THRESHOLD})"
+                print(f"  [BLOCKED] {client} - {count}/{BlockTracker.BLOCK_THRESHOLD}")
+        
+        elif result.get('status') == 'PASS':
+            if block_tracker:
+                block_tracker.record_success(url)
+            print(f"  [PASS] {client}")
+        
+        else:
+            print(f"  [{result.get('status')}] {client}")
+        
+        result['original_index'] = original_idx
+        on_result(row_idx, result)
+        
+        browser_count += 1
+        
+        # Human delay between scans
+        if is_running():
+            human_delay()
+    
+    try:
+        driver.quit()
+    except:
+        pass
+    
+    if block_tracker:
+        block_tracker.flush()
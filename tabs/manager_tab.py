@@ -1,14 +1,18 @@
 import sys
+import csv
+from contextlib import contextmanager
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-import qtawesome as qta 
 from datetime import datetime
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QTableWidget, QTableWidgetItem, QHeaderView, 
+                             QTableView, 
                              QMessageBox, QFileDialog, QLineEdit, QAbstractItemView, 
                              QFrame, QComboBox, QLabel, QDialog, QTextEdit,
                              QDialogButtonBox, QScrollArea)
-from PyQt6.QtGui import (QColor, QFont, QUndoStack, QUndoCommand)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import (QUndoStack, QUndoCommand)
+from PyQt6.QtCore import (Qt, pyqtSignal, QAbstractTableModel, QModelIndex,
+                          QSortFilterProxyModel, QTimer)
 
 import assets.styles as styles 
 
@@ -23,155 +27,379 @@ import harvester
 
 logger = get_logger(__name__)
 
+
+@lru_cache(maxsize=None)
+def pyarrow_csv():
+    """pyarrow.csv when installed, else None.
+
+    Imported on first use so pyarrow stays off the startup import path.
+    """
+    try:
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+    return pacsv
+
+
+def read_project_csv(path, columns):
+    """Read a project CSV as plain strings, keeping only the known columns.
+
+    Uses pyarrow's multi-threaded parser when installed. Only the wanted
+    columns are converted, all as text with empty cells left as "", so there
+    is no dtype inference pass. The legacy "Provider" column is kept for
+    migration.
+    """
+    wanted = set(columns) | {"Provider"}
+    pacsv = pyarrow_csv()
+    if pacsv is not None:
+        import pyarrow as pa
+        # Header first, so pyarrow never converts (or mis-infers) other columns
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            header = next(csv.reader(f), [])
+        include = [c for c in header if c in wanted]
+        if not include:
+            # An empty include_columns would mean "all columns" to pyarrow
+            return pd.DataFrame()
+        convert = pacsv.ConvertOptions(include_columns=include,
+                                       column_types={c: pa.string() for c in include})
+        return pacsv.read_csv(path, convert_options=convert).to_pandas()
+    return pd.read_csv(path, engine='c', dtype=str, na_filter=False,
+                       usecols=lambda c: c in wanted)
+
+
+def normalize_project_frame(df, columns):
+    """Migrate legacy columns and fill defaults on a freshly read project."""
+    # Handle legacy CSV files with single "Provider" column
+    # Map it to "Expected Provider" and leave "Detected Provider" empty
+    if "Provider" in df.columns and "Expected Provider" not in df.columns:
+        df = df.rename(columns={"Provider": "Expected Provider"})
+        logger.info("Mapped legacy 'Provider' column to 'Expected Provider'")
+
+    # Also handle case where Provider column exists alongside new columns
+    if "Provider" in df.columns and "Expected Provider" in df.columns:
+        # If Expected Provider is empty but Provider has data, copy it over
+        expected = df["Expected Provider"].to_numpy(dtype=object)
+        provider = df["Provider"].to_numpy(dtype=object)
+        missing = (expected == "") | pd.isna(expected)
+        has_provider = (provider != "") & ~pd.isna(provider)
+        df["Expected Provider"] = np.where(missing & has_provider, provider, expected)
+        logger.info("Copied Provider data to empty Expected Provider fields")
+
+    df = df.reindex(columns=columns, fill_value="")
+    for col, default in (('Status', 'PENDING'), ('Active', 'Yes')):
+        values = df[col].to_numpy(dtype=object)
+        df[col] = np.where((values == "") | pd.isna(values), default, values)
+    return df
+
+# --- TABLE MODEL ---
+class ClientTableModel(QAbstractTableModel):
+    """Client list model for the Manager table.
+
+    Cells live in a 2-D numpy object array of strings (rows x columns).
+    Row colours are resolved in data() from the Status/Active columns using
+    brushes built once, so no per-cell item or colour objects are created.
+    """
+    cell_edited = pyqtSignal(int, int)  # row, col - edits made in the view
+
+    STATUS_COL = 5
+    ACTIVE_COL = 9
+    CENTERED_COLS = (5, 7, 9)  # Status, Site Map, Active
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self._data = np.empty((0, len(self.columns)), dtype=object)
+
+        # Rows touched since the last take_changes(); inserts, deletes and
+        # resets move rows around, so they flag a structural change instead
+        self._changed_rows = set()
+        self._structure_changed = True
+        # Bumped on every write so derived data (e.g. the filter mask) can go stale
+        self.revision = 0
+        # col -> lowercased column for search; patched or dropped as cells change
+        self._lowered = {}
+
+        # (background, foreground) per row style
+        self._brushes = styles.row_brushes()
+        self._style_keys = styles.STATUS_ROW_STYLE
+        self._bold_font = styles.bold_table_font()
+
+    # --- Qt model interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._data)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return self.columns[section]
+            return str(section + 1)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsEditable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._data[row, col]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._row_brushes(row)[0]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._row_brushes(row)[1]
+        if col in self.CENTERED_COLS:
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            if role == Qt.ItemDataRole.FontRole:
+                return self._bold_font
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        row, col = index.row(), index.column()
+        value = "" if value is None else str(value)
+        if self._data[row, col] == value:
+            return False
+        self.set_value(row, col, value)
+        self.cell_edited.emit(row, col)
+        return True
+
+    # --- Row styling ---
+    def _row_brushes(self, row):
+        if self._data[row, self.ACTIVE_COL] != "Yes":
+            return self._brushes["inactive"]
+        return self._brushes[self._style_keys.get(self._data[row, self.STATUS_COL], "pending")]
+
+    # --- Data access ---
+    def set_rows(self, rows):
+        """Replace all rows with a 2-D array of strings."""
+        self.beginResetModel()
+        self._data = np.asarray(rows, dtype=object).reshape(-1, len(self.columns))
+        self._lowered = {}
+        self._structure_changed = True
+        self.revision += 1
+        self.endResetModel()
+
+    def to_dataframe(self):
+        """Snapshot the rows as a DataFrame (one copy of the 2-D array)."""
+        return pd.DataFrame(self._data, columns=self.columns, copy=True)
+
+    def value(self, row, col):
+        return self._data[row, col]
+
+    def column_values(self, col):
+        return self._data[:, col]
+
+    def lowered_column(self, col):
+        """Lowercased copy of a column, kept until that column changes."""
+        lowered = self._lowered.get(col)
+        if lowered is None:
+            lowered = pd.Series(self._data[:, col], dtype=object).str.lower().to_numpy(dtype=object, copy=True)
+            self._lowered[col] = lowered
+        return lowered
+
+    def row_values(self, row):
+        return list(self._data[row])
+
+    def row_records(self, rows):
+        """Return {row: {column name: text}} for the given rows."""
+        return {row: dict(zip(self.columns, self._data[row])) for row in rows}
+
+    def take_changes(self):
+        """Return and reset (changed rows, structure changed) since the last call."""
+        changes = (self._changed_rows, self._structure_changed)
+        self._changed_rows = set()
+        self._structure_changed = False
+        return changes
+
+    def set_value(self, row, col, text):
+        self.set_cells(row, {col: text})
+
+    def set_cells(self, row, values):
+        """Write several cells of one row with a single dataChanged for the row."""
+        for col, text in values.items():
+            self._data[row, col] = text
+            lowered = self._lowered.get(col)
+            if lowered is not None:
+                lowered[row] = text.lower()
+        self._changed_rows.add(row)
+        self.revision += 1
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1))
+
+    def update_rows(self, changes, track=True):
+        """Apply {row: {col: text}} and emit one dataChanged spanning the touched rows.
+
+        track=False leaves the rows out of take_changes(), for writes the
+        scanner already holds (scan results).
+        """
+        if not changes:
+            return
+        for row, values in changes.items():
+            for col, text in values.items():
+                self._data[row, col] = text
+                self._lowered.pop(col, None)
+        if track:
+            self._changed_rows.update(changes)
+        self.revision += 1
+        self.dataChanged.emit(self.index(min(changes), 0),
+                              self.index(max(changes), len(self.columns) - 1))
+
+    def set_column_values(self, rows, col, values):
+        """Write values (array-like, one per row) into col for the given rows."""
+        if len(rows) == 0:
+            return
+        self._data[rows, col] = values
+        self._lowered.pop(col, None)
+        self._changed_rows.update(rows.tolist())
+        self.revision += 1
+        self.dataChanged.emit(self.index(int(rows.min()), 0),
+                              self.index(int(rows.max()), len(self.columns) - 1))
+
+    def insert_row(self, row, values):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._data = np.insert(self._data, row, np.array(values, dtype=object), axis=0)
+        self._lowered = {}
+        self._structure_changed = True
+        self.revision += 1
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._data = np.delete(self._data, row, axis=0)
+        self._lowered = {}
+        self._structure_changed = True
+        self.revision += 1
+        self.endRemoveRows()
+
+
+class ClientFilterProxy(QSortFilterProxyModel):
+    """Sorts and filters the Manager view without reordering the model.
+
+    Model rows keep their file order, so saving, syncing and scanner row
+    indexes are unaffected by what the user has sorted or filtered.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._accepts = None  # callable(source_row) -> bool, or None for all rows
+
+    def set_row_filter(self, accepts):
+        self._accepts = accepts
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._accepts is None or self._accepts(source_row)
+
+
 # --- UNDO COMMANDS ---
 class CommandEditCell(QUndoCommand):
     def __init__(self, manager, row, col, old_text, new_text):
         super().__init__(f"Edit Cell {row},{col}")
         self.manager = manager
-        self.table = manager.table
+        self.model = manager.model
         self.row = row
         self.col = col
         self.old_text = old_text
         self.new_text = new_text
 
     def redo(self):
-        self.table.blockSignals(True)
-        item = self.table.item(self.row, self.col)
-        if not item:
-            item = QTableWidgetItem()
-            self.table.setItem(self.row, self.col, item)
-        item.setText(self.new_text)
-        self.table.blockSignals(False)
-        self.manager.update_row_style(self.row)
+        self.model.set_value(self.row, self.col, self.new_text)
 
     def undo(self):
-        self.table.blockSignals(True)
-        item = self.table.item(self.row, self.col)
-        if item: item.setText(self.old_text)
-        self.table.blockSignals(False)
-        self.manager.update_row_style(self.row)
+        self.model.set_value(self.row, self.col, self.old_text)
 
 class CommandToggleActive(QUndoCommand):
     def __init__(self, manager, row_indices):
         super().__init__("Toggle Active Status")
         self.manager = manager
-        self.table = manager.table
-        self.row_indices = row_indices
-        self.previous_states = {} 
+        self.model = manager.model
+        self.row_indices = np.asarray(row_indices, dtype=np.intp)
+        self.previous_states = None
 
     def redo(self):
-        self.table.blockSignals(True)
-        for row in self.row_indices:
-            item = self.table.item(row, 9)  # Active column is now index 9
-            if not item:
-                item = QTableWidgetItem("Yes")
-                self.table.setItem(row, 9, item)
-            current_val = item.text()
-            self.previous_states[row] = current_val
-            new_val = "No" if current_val == "Yes" else "Yes"
-            item.setText(new_val)
-            self.manager.update_row_style(row)
-        self.table.blockSignals(False)
+        # Active column is now index 9; keep the old values for undo
+        self.previous_states = self.model.column_values(9)[self.row_indices]
+        toggled = np.where(self.previous_states == "Yes", "No", "Yes").astype(object)
+        self.model.set_column_values(self.row_indices, 9, toggled)
         self.manager.emit_change()
 
     def undo(self):
-        self.table.blockSignals(True)
-        for row, old_val in self.previous_states.items():
-            self.table.item(row, 9).setText(old_val)  # Active column is now index 9
-            self.manager.update_row_style(row)
-        self.table.blockSignals(False)
+        self.model.set_column_values(self.row_indices, 9, self.previous_states)
         self.manager.emit_change()
 
 class CommandAddRow(QUndoCommand):
     def __init__(self, manager, row_idx):
         super().__init__("Add Row")
         self.manager = manager
-        self.table = manager.table
+        self.model = manager.model
         self.row_idx = row_idx
 
     def redo(self):
-        self.table.blockSignals(True)
-        self.table.insertRow(self.row_idx)
-        
         # Default Empty Row - 10 columns
-        self.table.setItem(self.row_idx, 0, QTableWidgetItem("New Client"))  # Client Name
-        self.table.setItem(self.row_idx, 1, QTableWidgetItem("https://"))    # URL
-        self.table.setItem(self.row_idx, 2, QTableWidgetItem(""))            # Expected Provider
-        self.table.setItem(self.row_idx, 3, QTableWidgetItem(""))            # Detected Provider
-        self.table.setItem(self.row_idx, 4, QTableWidgetItem(""))            # Config
-        self.table.setItem(self.row_idx, 5, QTableWidgetItem("PENDING"))     # Status
-        self.table.setItem(self.row_idx, 6, QTableWidgetItem(""))            # Details
-        self.table.setItem(self.row_idx, 7, QTableWidgetItem(""))            # Site Map
-        self.table.setItem(self.row_idx, 8, QTableWidgetItem(""))            # Offer
-        self.table.setItem(self.row_idx, 9, QTableWidgetItem("Yes"))         # Active
-
-        self.manager.update_row_style(self.row_idx)
-        self.table.blockSignals(False)
+        self.model.insert_row(self.row_idx, [
+            "New Client",  # Client Name
+            "https://",    # URL
+            "",            # Expected Provider
+            "",            # Detected Provider
+            "",            # Config
+            "PENDING",     # Status
+            "",            # Details
+            "",            # Site Map
+            "",            # Offer
+            "Yes",         # Active
+        ])
         self.manager.emit_change()
 
     def undo(self):
-        self.table.blockSignals(True)
-        self.table.removeRow(self.row_idx)
-        self.table.blockSignals(False)
+        self.model.remove_row(self.row_idx)
         self.manager.emit_change()
 
 class CommandDeleteRow(QUndoCommand):
     def __init__(self, manager, row_idx, row_data):
         super().__init__("Delete Row")
         self.manager = manager
-        self.table = manager.table
+        self.model = manager.model
         self.row_idx = row_idx
         self.row_data = row_data 
 
     def redo(self):
-        self.table.blockSignals(True)
-        self.table.removeRow(self.row_idx)
-        self.table.blockSignals(False)
+        self.model.remove_row(self.row_idx)
         self.manager.emit_change()
 
     def undo(self):
-        self.table.blockSignals(True)
-        self.table.insertRow(self.row_idx)
-        for col, text in enumerate(self.row_data):
-            self.table.setItem(self.row_idx, col, QTableWidgetItem(text))
-        self.manager.update_row_style(self.row_idx)
-        self.table.blockSignals(False)
+        self.model.insert_row(self.row_idx, self.row_data)
         self.manager.emit_change()
 
 class CommandResetStatus(QUndoCommand):
     def __init__(self, manager, row_indices):
         super().__init__("Reset Status")
         self.manager = manager
-        self.table = manager.table
+        self.model = manager.model
         self.row_indices = row_indices
         self.previous_data = {} # {row: {col: text}}
 
     def redo(self):
-        self.table.blockSignals(True)
         for row in self.row_indices:
             # Save state for undo
             self.previous_data[row] = {}
             for col in [4, 5, 6, 9]: # Config, Status, Details, Active (skip Site Map and Offer)
-                item = self.table.item(row, col)
-                self.previous_data[row][col] = item.text() if item else ""
-            
-            # Reset values
-            self.table.item(row, 4).setText("")          # Config -> Empty
-            self.table.item(row, 5).setText("PENDING")   # Status -> PENDING
-            self.table.item(row, 6).setText("")          # Details -> Empty
-            self.table.item(row, 9).setText("Yes")       # Active -> Yes
-            
-            self.manager.update_row_style(row)
-        self.table.blockSignals(False)
+                self.previous_data[row][col] = self.model.value(row, col)
+        
+        # Reset values: Config -> Empty, Status -> PENDING, Details -> Empty, Active -> Yes
+        reset = {4: "", 5: "PENDING", 6: "", 9: "Yes"}
+        self.model.update_rows({row: reset for row in self.row_indices})
         self.manager.emit_change()
 
     def undo(self):
-        self.table.blockSignals(True)
-        for row, cols in self.previous_data.items():
-            for col, text in cols.items():
-                self.table.item(row, col).setText(text)
-            self.manager.update_row_style(row)
-        self.table.blockSignals(False)
+        self.model.update_rows(self.previous_data)
         self.manager.emit_change()
 
 
@@ -206,44 +434,44 @@ class ManagerTab(QWidget):
 
         # Buttons
         self.btn_load = QPushButton(" Load List")
-        self.btn_load.setIcon(qta.icon('fa5s.folder-open', color='#555'))
+        self.btn_load.setIcon(styles.cached_icon('fa5s.folder-open', '#555'))
         self.btn_load.clicked.connect(self.load_csv)
         
         self.btn_save = QPushButton(" Save Changes")
         self.btn_save.setObjectName("btn_success")
-        self.btn_save.setIcon(qta.icon('fa5s.save', color='white'))
+        self.btn_save.setIcon(styles.cached_icon('fa5s.save', 'white'))
         self.btn_save.clicked.connect(self.save_csv)
 
         self.btn_undo = QPushButton(" Undo")
-        self.btn_undo.setIcon(qta.icon('fa5s.undo-alt', color='#555'))
-        self.btn_undo.clicked.connect(self.undo_stack.undo)
+        self.btn_undo.setIcon(styles.cached_icon('fa5s.undo-alt', '#555'))
+        self.btn_undo.clicked.connect(self.undo)
         self.btn_undo.setEnabled(False)
         self.undo_stack.canUndoChanged.connect(self.btn_undo.setEnabled)
         
         self.btn_import_offers = QPushButton(" Import Offers")
         self.btn_import_offers.setObjectName("btn_brand")
-        self.btn_import_offers.setIcon(qta.icon('fa5s.file-import', color='white'))
+        self.btn_import_offers.setIcon(styles.cached_icon('fa5s.file-import', 'white'))
         self.btn_import_offers.clicked.connect(self.import_offers)
         
         self.btn_add = QPushButton(" Add Manual")
-        self.btn_add.setIcon(qta.icon('fa5s.plus-circle', color='#555'))
+        self.btn_add.setIcon(styles.cached_icon('fa5s.plus-circle', '#555'))
         self.btn_add.clicked.connect(self.add_row)
         
         self.btn_reset = QPushButton(" Reset Status")
-        self.btn_reset.setIcon(qta.icon('fa5s.sync-alt', color='#555'))
+        self.btn_reset.setIcon(styles.cached_icon('fa5s.sync-alt', '#555'))
         self.btn_reset.clicked.connect(self.reset_status)
         
         self.btn_archive = QPushButton(" Archive")
-        self.btn_archive.setIcon(qta.icon('fa5s.archive', color='#555'))
+        self.btn_archive.setIcon(styles.cached_icon('fa5s.archive', '#555'))
         self.btn_archive.clicked.connect(self.toggle_archive)
         
         self.btn_del = QPushButton(" Delete")
         self.btn_del.setObjectName("btn_danger")
-        self.btn_del.setIcon(qta.icon('fa5s.trash-alt', color='white'))
+        self.btn_del.setIcon(styles.cached_icon('fa5s.trash-alt', 'white'))
         self.btn_del.clicked.connect(self.delete_row)
         
         self.btn_sitemap = QPushButton(" View Site Map")
-        self.btn_sitemap.setIcon(qta.icon('fa5s.sitemap', color='#555'))
+        self.btn_sitemap.setIcon(styles.cached_icon('fa5s.sitemap', '#555'))
         self.btn_sitemap.clicked.connect(self.view_site_map)
 
         self.undo_stack.indexChanged.connect(self.emit_change)
@@ -265,7 +493,13 @@ class ManagerTab(QWidget):
         filter_layout = QHBoxLayout()
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("🔍 Search Client or URL...")
-        self.search_bar.textChanged.connect(self.filter_table)
+        # Typing restarts the timer, so the filter runs once per pause
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.filter_table)
+        self.search_bar.textChanged.connect(self._filter_timer.start)
+        self._applied_filter = ("", "All Statuses")  # (search text, status) the view shows
         
         self.filter_combo = QComboBox()
         self.filter_combo.addItems(["All Statuses", "PENDING", "PASS", "FAIL", "WARN", "BLOCKED", "N/A", "ERROR", "ARCHIVED"])
@@ -273,7 +507,7 @@ class ManagerTab(QWidget):
         
         # Add arrow indicator label (workaround for CSS arrow not rendering)
         arrow_label = QLabel("▼")
-        arrow_label.setStyleSheet(f"color: {styles.COLORS['text_secondary']}; font-size: 10px; background: transparent; margin-left: -20px;")
+        arrow_label.setObjectName("filter_arrow")
 
         filter_layout.addWidget(self.search_bar)
         filter_layout.addWidget(QLabel("Filter by:"))
@@ -282,122 +516,67 @@ class ManagerTab(QWidget):
         layout.addLayout(filter_layout)
 
         # --- Table ---
-        self.table = QTableWidget()
-        self.table.setColumnCount(len(self.columns)) 
-        self.table.setHorizontalHeaderLabels(self.columns)
+        self.model = ClientTableModel(self.columns, self)
+        self.proxy = ClientFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        # Keep file order until a header is clicked
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.table.setSortingEnabled(True)
         
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # URL
-        
-        # Column widths - 10 columns
-        # 0: Client Name, 1: URL (stretch), 2: Expected Provider, 3: Detected Provider
-        # 4: Config, 5: Status, 6: Details, 7: Site Map, 8: Offer, 9: Active
-        self.table.setColumnWidth(0, 300)   # Client Name
-        self.table.setColumnWidth(2, 150)   # Expected Provider
-        self.table.setColumnWidth(3, 150)   # Detected Provider
-        self.table.setColumnWidth(4, 70)    # Config
-        self.table.setColumnWidth(5, 110)   # Status
-        self.table.setColumnWidth(6, 120)   # Details
-        self.table.setColumnWidth(7, 80)    # Site Map
-        self.table.setColumnWidth(8, 180)   # Offer
-        self.table.setColumnWidth(9, 65)    # Active
+        styles.apply_table_layout(self.table)
         
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.table.itemChanged.connect(self.on_item_changed)
         
         layout.addWidget(self.table)
     
+    @contextmanager
+    def batched_updates(self):
+        """Suspend viewport repaints for a bulk mutation and repaint once at the end."""
+        self.table.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
+
+    def undo(self):
+        # Undoing a macro (e.g. "Delete Rows") replays one command per row
+        with self.batched_updates():
+            self.undo_stack.undo()
+
     def emit_change(self):
         self.data_modified.emit()
 
     def get_dataframe(self):
-        data = []
-        for r in range(self.table.rowCount()):
-            row_data = {}
-            for c, col_name in enumerate(self.columns):
-                item = self.table.item(r, c)
-                row_data[col_name] = item.text() if item else ""
-            data.append(row_data)
-        return pd.DataFrame(data)
-
-    def update_row_style(self, row):
-        if row >= self.table.rowCount(): return
-
-        # Active column is now index 9
-        active_item = self.table.item(row, 9)
-        is_active = active_item.text() == "Yes" if active_item else True
-        
-        # Status column is index 5
-        status_item = self.table.item(row, 5)
-        if status_item:
-            status_text = status_item.data(Qt.ItemDataRole.UserRole)
-            if status_text is None:
-                status_text = status_item.text().replace("📋", "").strip()
-        else:
-            status_text = ""
-        
-        bg_color = QColor(styles.COLORS["row_pending_bg"])
-        text_color = QColor(styles.COLORS["row_pending_text"])
-
-        if not is_active:
-            bg_color = QColor(styles.COLORS["row_inactive_bg"])
-            text_color = QColor(styles.COLORS["row_inactive_text"])
-        else:
-            if status_text == 'PASS':
-                bg_color = QColor(styles.COLORS["row_pass_bg"])
-                text_color = QColor(styles.COLORS["row_pass_text"])
-            elif status_text in ['WARN', 'BLOCKED']:
-                bg_color = QColor(styles.COLORS["row_warn_bg"])
-                text_color = QColor(styles.COLORS["row_warn_text"])
-            elif status_text in ['FAIL', 'ERROR']:
-                bg_color = QColor(styles.COLORS["row_fail_bg"])
-                text_color = QColor(styles.COLORS["row_fail_text"])
-            elif status_text in ['UNVERIFIABLE', 'N/A']:
-                bg_color = QColor(styles.COLORS["row_unverifiable_bg"])
-                text_color = QColor(styles.COLORS["row_unverifiable_text"])
-            elif status_text == 'PENDING':
-                bg_color = QColor(styles.COLORS["row_pending_bg"])
-                text_color = QColor(styles.COLORS["row_pending_text"])
-
-        for col in range(self.table.columnCount()):
-            item = self.table.item(row, col)
-            if item:
-                item.setBackground(bg_color)
-                item.setForeground(text_color)
-                
-                # Status (5), Site Map (7), and Active (9) columns get centered bold text
-                if col in [5, 7, 9]: 
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    item.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        return self.model.to_dataframe()
+
+    def apply_scan_results(self, results):
+        """Write scanner results straight to the model.
+
+        results is a list of (row, status, msg, vendor, config). These are not
+        user edits, so no undo commands are created and data_modified is not
+        emitted (the scanner already holds the same values).
+        """
+        changes = {}
+        row_count = self.model.rowCount()
+        for row, status, msg, vendor, config in results:
+            if row >= row_count:
+                continue
+            # Detected Provider (3), Status (5), Details (6); Config (4) only when found
+            cells = changes.setdefault(row, {})
+            cells.update({3: vendor if vendor else "", 5: status, 6: msg})
+            if config:
+                cells[4] = config
+        self.model.update_rows(changes, track=False)
 
     def load_csv(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open CSV", "", "CSV Files (*.csv)")
         if path:
             self.file_path = path
             try:
-                self.df = pd.read_csv(path)
-                
-                # Handle legacy CSV files with single "Provider" column
-                # Map it to "Expected Provider" and leave "Detected Provider" empty
-                if "Provider" in self.df.columns and "Expected Provider" not in self.df.columns:
-                    self.df = self.df.rename(columns={"Provider": "Expected Provider"})
-                    logger.info("Mapped legacy 'Provider' column to 'Expected Provider'")
-                
-                # Also handle case where Provider column exists alongside new columns
-                # (in case of partial migration)
-                if "Provider" in self.df.columns and "Expected Provider" in self.df.columns:
-                    # If Expected Provider is empty but Provider has data, copy it over
-                    mask = (self.df["Expected Provider"].isna() | (self.df["Expected Provider"] == "")) & \
-                           (self.df["Provider"].notna() & (self.df["Provider"] != ""))
-                    self.df.loc[mask, "Expected Provider"] = self.df.loc[mask, "Provider"]
-                    logger.info("Copied Provider data to empty Expected Provider fields")
-                
-                self.df = self.df.reindex(columns=self.columns, fill_value="")
-                
-                self.df['Status'] = self.df['Status'].replace("", "PENDING").fillna('PENDING')
-                self.df['Active'] = self.df['Active'].replace("", "Yes").fillna('Yes')
+                self.df = normalize_project_frame(read_project_csv(path, self.columns), self.columns)
                 
                 self.undo_stack.clear()
                 self.populate_table()
@@ -406,72 +585,50 @@ class ManagerTab(QWidget):
                 QMessageBox.critical(self, "Error", str(e))
 
     def populate_table(self):
-        self.table.setSortingEnabled(False)
-        self.table.blockSignals(True)
-        self.table.setRowCount(0)
+        df = self.df.reindex(columns=self.columns)
+        rows = df.astype(object).where(df.notna(), "").astype(str).to_numpy()
         
-        for i, row in self.df.iterrows():
-            self.table.insertRow(i)
-            
-            # Get URL for site map check
-            url = str(row.get('URL', '')) if pd.notna(row.get('URL', '')) else ""
+        # For Status column, clean any legacy icons
+        rows[:, 5] = pd.Series(rows[:, 5]).str.replace('📋', '', regex=False).str.strip().to_numpy()
+        
+        # For Site Map column, set based on whether site map exists
+        for i, url in enumerate(rows[:, 1]):
             check_url = url if url.startswith('http') else f"https://{url}"
-            has_sitemap = url and harvester.has_site_map(check_url)
-            
-            for c, col_name in enumerate(self.columns):
-                val = str(row[col_name]) if pd.notna(row[col_name]) else ""
-                
-                # For Status column, clean any legacy icons
-                if c == 5:  # Status column
-                    val = val.replace('📋', '').strip()
-                
-                # For Site Map column, set based on whether site map exists
-                if c == 7:  # Site Map column
-                    val = "Yes" if has_sitemap else ""
-                
-                item = QTableWidgetItem(val)
-                
-                # Store actual status in UserRole for Status column
-                if c == 5:
-                    item.setData(Qt.ItemDataRole.UserRole, val)
-                
-                self.table.setItem(i, c, item)
-
-            self.update_row_style(i)
-            
-        self.table.blockSignals(False)
-        self.table.setSortingEnabled(True)
+            rows[i, 7] = "Yes" if url and harvester.has_site_map(check_url) else ""
+        
+        self.model.set_rows(rows)
 
-    def on_item_changed(self, item):
-        pass 
+    def selected_rows(self):
+        """Model rows of the current selection (view rows mapped through the proxy)."""
+        # One index per selected row (rows are selected whole), not one per cell
+        return sorted(self.proxy.mapToSource(index).row()
+                      for index in self.table.selectionModel().selectedRows())
 
     def add_row(self):
-        row_idx = self.table.rowCount()
+        row_idx = self.model.rowCount()
         command = CommandAddRow(self, row_idx) 
         self.undo_stack.push(command)
-        self.table.scrollToBottom()
+        self.table.scrollTo(self.proxy.mapFromSource(self.model.index(row_idx, 0)))
 
     def delete_row(self):
-        rows = sorted(set(index.row() for index in self.table.selectedIndexes()), reverse=True)
+        rows = self.selected_rows()[::-1]
         if not rows: return
-        self.undo_stack.beginMacro("Delete Rows")
-        for row_idx in rows:
-            row_data = []
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row_idx, col)
-                row_data.append(item.text() if item else "")
-            command = CommandDeleteRow(self, row_idx, row_data)
-            self.undo_stack.push(command)
-        self.undo_stack.endMacro()
+        with self.batched_updates():
+            self.undo_stack.beginMacro("Delete Rows")
+            for row_idx in rows:
+                row_data = self.model.row_values(row_idx)
+                command = CommandDeleteRow(self, row_idx, row_data)
+                self.undo_stack.push(command)
+            self.undo_stack.endMacro()
         
     def toggle_archive(self):
-        rows = sorted(set(index.row() for index in self.table.selectedIndexes()))
+        rows = self.selected_rows()
         if not rows: return
         command = CommandToggleActive(self, rows)
         self.undo_stack.push(command)
 
     def reset_status(self):
-        rows = sorted(set(index.row() for index in self.table.selectedIndexes()))
+        rows = self.selected_rows()
         if not rows: 
             QMessageBox.information(self, "Select Rows", "Please select rows to reset.")
             return
@@ -529,18 +686,13 @@ class ManagerTab(QWidget):
             
             # Build lookup from current table (Client Name -> row index)
             client_to_row = {}
-            for row in range(self.table.rowCount()):
-                client_item = self.table.item(row, 0)
-                if client_item:
-                    client_name = client_item.text().strip()
-                    client_to_row[client_name] = row
+            for row, client_name in enumerate(self.model.column_values(0)):
+                client_to_row[client_name.strip()] = row
             
             # Process imports
             updated = 0
             not_found = []
             
-            self.table.blockSignals(True)
-            
             for _, import_row in import_df.iterrows():
                 client_name = str(import_row['Client Name']).strip()
                 offer_value = str(import_row['Offer']).strip() if pd.notna(import_row['Offer']) else ""
@@ -548,16 +700,11 @@ class ManagerTab(QWidget):
                 if client_name in client_to_row:
                     row_idx = client_to_row[client_name]
                     # Update Offer column (index 8)
-                    offer_item = self.table.item(row_idx, 8)
-                    if offer_item:
-                        offer_item.setText(offer_value)
-                    else:
-                        self.table.setItem(row_idx, 8, QTableWidgetItem(offer_value))
+                    self.model.set_value(row_idx, 8, offer_value)
                     updated += 1
                 else:
                     not_found.append(client_name)
             
-            self.table.blockSignals(False)
             self.emit_change()
             
             # Show summary
@@ -577,36 +724,56 @@ class ManagerTab(QWidget):
             QMessageBox.critical(self, "Import Error", f"Error importing offers:\n{str(e)}")
 
     def filter_table(self):
+        self._filter_timer.stop()
         search_text = self.search_bar.text().lower()
         status_filter = self.filter_combo.currentText()
-        
-        for r in range(self.table.rowCount()):
-            item_name = self.table.item(r, 0)
-            item_url = self.table.item(r, 1)
-            text_match = False
-            if (item_name and search_text in item_name.text().lower()) or \
-               (item_url and search_text in item_url.text().lower()):
-                text_match = True
-            
+
+        # Same filter as on screen (e.g. text typed then deleted within the
+        # debounce): skip re-filtering; edits reach the proxy via the model
+        if (search_text, status_filter) == self._applied_filter:
+            return
+        self._applied_filter = (search_text, status_filter)
+
+        if not search_text and status_filter == "All Statuses":
+            self.proxy.set_row_filter(None)
+            return
+
+        mask_cache = {"revision": None, "mask": None}
+
+        def accepts(r):
+            # The mask covers every row at once; rebuild it only after the data changed
+            if mask_cache["revision"] != self.model.revision:
+                mask_cache["mask"] = self._filter_mask(search_text, status_filter)
+                mask_cache["revision"] = self.model.revision
+            return bool(mask_cache["mask"][r])
+
+        self.proxy.set_row_filter(accepts)
+
+    def _filter_mask(self, search_text, status_filter):
+        """Boolean array of rows matching the search text and status filter."""
+        model = self.model
+        if search_text:
+            # Lowercased once per edit, not once per keystroke
+            names = pd.Series(model.lowered_column(0), dtype=object)
+            urls = pd.Series(model.lowered_column(1), dtype=object)
+            text_match = (names.str.contains(search_text, regex=False, na=False).to_numpy(dtype=bool)
+                          | urls.str.contains(search_text, regex=False, na=False).to_numpy(dtype=bool))
+        else:
+            text_match = np.ones(model.rowCount(), dtype=bool)
+
+        status = model.column_values(5)   # Status column is 5
+        active = model.column_values(9)   # Active column is now 9
+        if status_filter == "ARCHIVED":
+            status_match = active != "Yes"
+        elif status_filter == "N/A":
+            # N/A filter matches both "N/A" display and "UNVERIFIABLE" data
+            status_match = (active != "No") & ((status == "N/A") | (status == "UNVERIFIABLE"))
+        elif status_filter != "All Statuses":
+            status_match = (active != "No") & (status == status_filter)
+        else:
             status_match = True
-            item_status = self.table.item(r, 5)   # Status column is 5
-            item_active = self.table.item(r, 9)   # Active column is now 9
-            
-            if status_filter == "ARCHIVED":
-                if item_active.text() == "Yes": status_match = False
-            elif status_filter == "N/A":
-                # N/A filter matches both "N/A" display and "UNVERIFIABLE" data
-                if item_active.text() == "No":
-                    status_match = False
-                elif item_status.text() not in ["N/A", "UNVERIFIABLE"]:
-                    status_match = False
-            elif status_filter != "All Statuses":
-                if item_active.text() == "No": 
-                    status_match = False 
-                elif item_status.text() != status_filter:
-                    status_match = False
-
-            self.table.setRowHidden(r, not (text_match and status_match))
+
+        return text_match & status_match
 
     def sync_to_database(self):
         """Sync current table data to database"""
@@ -625,15 +792,15 @@ class ManagerTab(QWidget):
 
     def view_site_map(self):
         """Show site map dialog for selected row."""
-        selected = self.table.selectedItems()
+        selected = self.table.selectionModel().selectedRows()
         if not selected:
             QMessageBox.information(self, "No Selection", "Please select a row to view its site map.")
             return
         
-        row = selected[0].row()
-        client_name = self.table.item(row, 0).text() if self.table.item(row, 0) else "Unknown"
-        url = self.table.item(row, 1).text() if self.table.item(row, 1) else ""
-        provider = self.table.item(row, 2).text() if self.table.item(row, 2) else ""  # Expected Provider
+        row = self.proxy.mapToSource(selected[0]).row()
+        client_name = self.model.value(row, 0) or "Unknown"
+        url = self.model.value(row, 1)
+        provider = self.model.value(row, 2)  # Expected Provider
         
         if not url:
             QMessageBox.warning(self, "No URL", "Selected row has no URL.")
@@ -665,7 +832,6 @@ class SiteMapDialog(QDialog):
         
         # Header
         header_label = QLabel(f"<b style='font-size: 16px;'>{client_name}</b>")
-        header_label.setStyleSheet("background: transparent;")
         layout.addWidget(header_label)
         
         # Metadata
@@ -683,7 +849,7 @@ class SiteMapDialog(QDialog):
             meta_text = "No site map data available"
         
         meta_label = QLabel(meta_text)
-        meta_label.setStyleSheet(f"color: {styles.COLORS['text_secondary']}; background: transparent;")
+        meta_label.setObjectName("site_map_meta")
         layout.addWidget(meta_label)
         
         # Separator
@@ -696,12 +862,7 @@ class SiteMapDialog(QDialog):
         # Content area (scrollable)
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: {styles.COLORS['bg_white']};
-            }}
-        """)
+        scroll.setObjectName("site_map_scroll")
         
         content_widget = QWidget()
         content_layout = QVBoxLayout(content_widget)
@@ -716,7 +877,7 @@ class SiteMapDialog(QDialog):
                 
                 # Category label (bold)
                 cat_label = QLabel(f"<b>{category}</b>")
-                cat_label.setStyleSheet("background: transparent; margin-top: 8px;")
+                cat_label.setObjectName("site_map_category")
                 content_layout.addWidget(cat_label)
                 
                 if urls:
@@ -724,20 +885,11 @@ class SiteMapDialog(QDialog):
                         url_label = QLabel(url_item)
                         url_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
                         url_label.setWordWrap(True)
-                        url_label.setStyleSheet(f"""
-                            color: {styles.COLORS['brand_primary']}; 
-                            background: transparent;
-                            padding-left: 10px;
-                        """)
+                        url_label.setObjectName("site_map_url")
                         content_layout.addWidget(url_label)
                 else:
                     not_found = QLabel("Not found")
-                    not_found.setStyleSheet(f"""
-                        color: {styles.COLORS['text_tertiary']}; 
-                        font-style: italic;
-                        background: transparent;
-                        padding-left: 10px;
-                    """)
+                    not_found.setObjectName("site_map_not_found")
                     content_layout.addWidget(not_found)
             
             # Other links section
@@ -751,7 +903,7 @@ class SiteMapDialog(QDialog):
                 
                 other_label = QLabel(f"<b>Other:</b> {', '.join(other[:15])}")
                 other_label.setWordWrap(True)
-                other_label.setStyleSheet(f"color: {styles.COLORS['text_secondary']}; background: transparent; margin-top: 5px;")
+                other_label.setObjectName("site_map_other")
                 content_layout.addWidget(other_label)
         else:
             # No data message
@@ -760,7 +912,7 @@ class SiteMapDialog(QDialog):
                 "Site maps are automatically collected during scans,\n"
                 "or you can use 'Check Site Map' in the Scanner tab."
             )
-            no_data.setStyleSheet(f"color: {styles.COLORS['text_secondary']}; background: transparent; padding: 20px;")
+            no_data.setObjectName("site_map_empty")
             no_data.setAlignment(Qt.AlignmentFlag.AlignCenter)
             content_layout.addWidget(no_data)
         
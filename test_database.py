@@ -214,6 +214,32 @@ def test_statistics():
         print("⚠️  No statistics available yet")
         return True  # Not an error if database is new
 
+def test_settings():
+    """Test the app_settings key/value table"""
+    print("\n" + "=" * 60)
+    print("TESTING SETTINGS")
+    print("=" * 60)
+    
+    db = get_database()
+    key = "test_setting"
+    
+    print("\n→ Reading a missing setting...")
+    missing = db.get_setting("test_setting_missing", "fallback")
+    print(f"  Default returned: {missing}")
+    
+    print("\n→ Writing and overwriting a setting...")
+    db.set_setting(key, "first")
+    db.set_setting(key, "second")
+    value = db.get_setting(key)
+    print(f"  Stored value: {value}")
+    
+    if missing == "fallback" and value == "second":
+        print("✓ Settings round-trip correctly")
+        return True
+    else:
+        print("✗ Settings did not round-trip!")
+        return False
+
 def cleanup_test_data():
     """Clean up test data (optional)"""
     print("\n" + "=" * 60)
@@ -261,6 +287,7 @@ def main():
         ("DataFrame Export", test_dataframe_export),
         ("Backup Creation", test_backup_creation),
         ("Statistics", test_statistics),
+        ("Settings", test_settings),
     ]
     
     results = [("Database Connection", True), ("Add Site", True)]  # Already passed
@@ -4,6 +4,10 @@ Run this with: python test_logging.py
 """
 
 from logger import get_logger, LogExecutionTime, get_recent_logs, get_error_logs
+import logger as logger_module
+import logging
+import logging.handlers
+import tempfile
 import time
 from pathlib import Path
 
@@ -156,6 +160,54 @@ def test_log_reading():
     
     return True
 
+def test_log_rotation():
+    """Test gzip rotation and reading across the rotated segment"""
+    print("\n" + "=" * 60)
+    print("TESTING LOG ROTATION")
+    print("=" * 60)
+    
+    log_dir = Path(tempfile.mkdtemp())
+    handler = logging.handlers.RotatingFileHandler(
+        log_dir / 'mom.log', maxBytes=300, backupCount=2, encoding='utf-8'
+    )
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    handler.namer = logger_module._gzip_namer
+    handler.rotator = logger_module._gzip_rotator
+    
+    rotation_logger = logging.getLogger("test_rotation")
+    rotation_logger.propagate = False
+    rotation_logger.addHandler(handler)
+    print("\n→ Writing enough lines to rotate several times...")
+    try:
+        for i in range(30):
+            rotation_logger.info(f"rotation line {i:02d} " + "x" * 40)
+    finally:
+        rotation_logger.removeHandler(handler)
+        handler.close()
+    
+    files = sorted(path.name for path in log_dir.iterdir())
+    print(f"  Files: {', '.join(files)}")
+    
+    print("\n→ Reading the tail across the rotated backup...")
+    saved_dir = logger_module.LOGS_DIR
+    logger_module.LOGS_DIR = log_dir
+    try:
+        current = logger_module._tail_lines(log_dir / 'mom.log', 50)
+        lines = get_recent_logs(max_lines=len(current) + 2)
+    finally:
+        logger_module.LOGS_DIR = saved_dir
+    numbers = [int(line.split("rotation line ")[1][:2]) for line in lines]
+    print(f"  Line numbers read: {numbers}")
+    
+    if files != ['mom.log', 'mom.log.1.gz', 'mom.log.2.gz']:
+        print("✗ Unexpected backup files!")
+        return False
+    if numbers != list(range(30 - len(numbers), 30)):
+        print("✗ Tail is not the newest lines in order!")
+        return False
+    print("✓ Backups are gzipped, capped by backupCount, and read in order")
+    return True
+
 def main():
     """Run all logging tests"""
     print("\n" + "=" * 60)
@@ -170,6 +222,7 @@ def main():
         ("Error Logging", test_error_logging),
         ("Log Files", test_log_files),
         ("Log Reading", test_log_reading),
+        ("Log Rotation", test_log_rotation),
     ]
     
     results = []
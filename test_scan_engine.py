@@ -0,0 +1,250 @@
+"""
+Test script for the Qt-free scan logic in scan_engine
+Run this with: python test_scan_engine.py
+
+Page rules are checked twice: with the optional fast paths (pyahocorasick,
+selectolax) when installed, and again with them switched off so the
+substring / BeautifulSoup fallbacks are covered too.
+"""
+
+import tempfile
+import time
+from contextlib import contextmanager
+
+import requests
+
+import scan_engine
+from scan_engine import (BASE_TARGET, BlockTracker, evaluate_page, detect_provider,
+                         evaluate_http_response, http_error_result, retry_delay,
+                         should_retry, HTTP_MAX_ATTEMPTS, HTTP_MAX_RETRY_DELAY)
+
+
+def script(kind=None):
+    """A script tag for behaviour.js, or behaviour.<kind>.js"""
+    suffix = f".{kind}" if kind else ""
+    return f'<script src="https://cdn.{BASE_TARGET}{suffix}.js"></script>'
+
+
+def page(head="", body="", title="Test Dealer", text=""):
+    return (f"<html><head><title>{title}</title>{head}</head>"
+            f"<body><p>{text}</p>{body}</body></html>")
+
+
+# (description, html, expected (status, config, vendor))
+PAGE_CASES = [
+    ("SPA rule of 4", page(body=script("spa") * 4), ("PASS", "SPA", "Other")),
+    ("SPA short", page(body=script("spa") * 3), ("WARN", "SPA", "Other")),
+    ("SPA in head", page(head=script("spa"), body=script("spa") * 3), ("WARN", "SPA", "Other")),
+    ("DCOM rule of 1", page(body=script("dcom")), ("PASS", "DCOM", "Other")),
+    ("DCOM twice", page(body=script("dcom") * 2), ("WARN", "DCOM", "Other")),
+    ("BUNDLE rule of 2", page(body=script("bundle") * 2), ("PASS", "BUNDLE", "Other")),
+    ("BUNDLE in head", page(head=script("bundle"), body=script("bundle")), ("WARN", "BUNDLE", "Other")),
+    ("STD rule of 2", page(body=script() * 2), ("PASS", "STD", "Other")),
+    ("STD single", page(body=script()), ("WARN", "STD", "Other")),
+    ("SPA wins over STD", page(body=script() * 2 + script("spa") * 4), ("PASS", "SPA", "Other")),
+    ("DealerOn single STD", page(body=script(), text="Website by DealerOn"), ("PASS", "STD", "DealerOn")),
+    ("DealerOn double STD", page(body=script() * 2, text="Website by DealerOn"), ("WARN", "STD", "DealerOn")),
+    ("Dealer.com single STD", page(body='<div class="ddc-wrapper"></div>' + script()), ("PASS", "STD", "Dealer.com")),
+    ("No scripts", page(text="Welcome"), ("FAIL", "NONE", "Other")),
+    ("Bot challenge", page(title="Just a moment...", text="Verify you are human"), ("BLOCKED", "ERR", "Security Block")),
+    ("Challenge text but script present", page(body=script() * 2, text="verify you are human"), ("PASS", "STD", "Other")),
+]
+
+# (description, lowercased html, visible text, expected vendor)
+PROVIDER_CASES = [
+    ("Sokal keeps its title case", '<link href="https://sokal.com/x.css">', "", "Sokal"),
+    ("Text marker", "<html></html>", "powered by dealer eprocess", "Dealer eProcess"),
+    ("Higher priority vendor wins", '<div id="di-root"></div><a href="dealeron.com">', "", "Dealer Inspire"),
+    ("Unknown platform", "<html></html>", "welcome", "Other"),
+]
+
+
+@contextmanager
+def fallback_paths():
+    """Run with pyahocorasick and selectolax switched off"""
+    saved = (scan_engine._PROVIDER_AUTOMATA, scan_engine._BLOCK_AUTOMATON, scan_engine.LexborHTMLParser)
+    scan_engine._PROVIDER_AUTOMATA = None
+    scan_engine._BLOCK_AUTOMATON = None
+    scan_engine.LexborHTMLParser = None
+    try:
+        yield
+    finally:
+        (scan_engine._PROVIDER_AUTOMATA, scan_engine._BLOCK_AUTOMATON,
+         scan_engine.LexborHTMLParser) = saved
+
+
+def check_page_rules(label):
+    print(f"\n→ Page rules ({label})...")
+    ok = True
+    for description, html, expected in PAGE_CASES:
+        status, msg, config, vendor = evaluate_page(html)
+        passed = (status, config, vendor) == expected
+        ok &= passed
+        mark = "✓" if passed else "✗"
+        print(f"  {mark} {description}: {status} {config} {vendor} ({msg})")
+    for description, html, text, expected in PROVIDER_CASES:
+        vendor = detect_provider(html, text)
+        passed = vendor == expected
+        ok &= passed
+        mark = "✓" if passed else "✗"
+        print(f"  {mark} {description}: {vendor}")
+    return ok
+
+
+def test_page_rules():
+    """evaluate_page / detect_provider with whichever parsers are installed"""
+    print("=" * 60)
+    print("TESTING PAGE RULES")
+    print("=" * 60)
+    fast = [name for name, mod in (("pyahocorasick", scan_engine.ahocorasick),
+                                   ("selectolax", scan_engine.LexborHTMLParser)) if mod is not None]
+    return check_page_rules(", ".join(fast) if fast else "fallbacks only")
+
+
+def test_page_rules_fallback():
+    """The same cases through the substring / BeautifulSoup fallbacks"""
+    print("\n" + "=" * 60)
+    print("TESTING PAGE RULES WITHOUT OPTIONAL PARSERS")
+    print("=" * 60)
+    with fallback_paths():
+        return check_page_rules("fallbacks")
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+def test_http_tier():
+    """Status mapping for the HTTP preflight"""
+    print("\n" + "=" * 60)
+    print("TESTING HTTP TIER")
+    print("=" * 60)
+
+    # (description, result, expected status or None for "needs browser")
+    cases = [
+        ("403 goes to the browser", evaluate_http_response(FakeResponse(403)), None),
+        ("429 goes to the browser", evaluate_http_response(FakeResponse(429)), None),
+        ("503 goes to the browser", evaluate_http_response(FakeResponse(503)), None),
+        ("404 is a FAIL", evaluate_http_response(FakeResponse(404)), "FAIL"),
+        ("Bot page goes to the browser",
+         evaluate_http_response(FakeResponse(200, page(body=script() * 2, text="Checking your browser"))), None),
+        ("Server-rendered PASS", evaluate_http_response(FakeResponse(200, page(body=script() * 2))), "PASS"),
+        ("Server-rendered WARN is rechecked", evaluate_http_response(FakeResponse(200, page(body=script()))), None),
+        ("No script in raw HTML", evaluate_http_response(FakeResponse(200, page(text="Welcome"))), None),
+        ("Timeout goes to the browser", http_error_result(requests.Timeout("slow")), None),
+        ("SSL error", http_error_result(requests.exceptions.SSLError("bad cert")), "FAIL"),
+        ("DNS failure", http_error_result(requests.exceptions.ConnectionError("Name or service not known")), "FAIL"),
+        ("Connection refused", http_error_result(requests.exceptions.ConnectionError("Connection refused")), "FAIL"),
+        ("No route to host", http_error_result(requests.exceptions.ConnectionError("No route to host")), "FAIL"),
+        ("Other connection error", http_error_result(requests.exceptions.ConnectionError("reset by peer")), None),
+        ("Unexpected error", http_error_result(ValueError("boom")), None),
+    ]
+
+    ok = True
+    print()
+    for description, result, expected in cases:
+        status = result['status'] if result else None
+        passed = status == expected and (result is None or result['method'] == 'http_quick')
+        ok &= passed
+        mark = "✓" if passed else "✗"
+        detail = f"{result['status']} ({result['vendor']}: {result['msg']})" if result else "needs browser"
+        print(f"  {mark} {description}: {detail}")
+
+    print("\n→ Retry policy...")
+    retry_checks = [
+        ("429 retried", should_retry(FakeResponse(429), 0)),
+        ("503 retried", should_retry(FakeResponse(503), 0)),
+        ("No retry on last attempt", not should_retry(FakeResponse(429), HTTP_MAX_ATTEMPTS - 1)),
+        ("No retry on 200", not should_retry(FakeResponse(200), 0)),
+        ("Retry-After honoured", retry_delay(FakeResponse(429, headers={'Retry-After': '4'}), 0) == 4),
+        ("Retry-After capped", retry_delay(FakeResponse(429, headers={'Retry-After': '600'}), 0) == HTTP_MAX_RETRY_DELAY),
+        ("Exponential backoff", 2 <= retry_delay(FakeResponse(503), 1) < 3),
+    ]
+    for description, passed in retry_checks:
+        ok &= passed
+        print(f"  {'✓' if passed else '✗'} {description}")
+
+    return ok
+
+
+def test_block_tracker():
+    """Block history is coalesced during a scan and written by flush()"""
+    print("\n" + "=" * 60)
+    print("TESTING BLOCK TRACKER")
+    print("=" * 60)
+
+    data_dir = tempfile.mkdtemp()
+    tracker = BlockTracker(data_dir)
+    writes = []
+    save = tracker._save
+    tracker._save = lambda: (writes.append(time.monotonic()), save())
+
+    print("\n→ Recording blocks in a burst...")
+    for _ in range(3):
+        tracker.record_block("https://blocked-dealer.com/inventory")
+    tracker.record_success("https://fine-dealer.com")
+    burst_writes = len(writes)
+    print(f"  Disk writes during burst: {burst_writes}")
+
+    tracker.flush()
+    tracker.flush()
+    print(f"  Disk writes after two flushes: {len(writes)}")
+
+    reloaded = BlockTracker(data_dir)
+    checks = [
+        ("Burst written once", burst_writes == 1),
+        ("Flush writes the rest once", len(writes) == 2),
+        ("Nothing pending after flush", not tracker._dirty),
+        ("History survives reload", reloaded.block_history == tracker.block_history),
+        ("Blocked site is unverifiable", reloaded.is_unverifiable("https://blocked-dealer.com")),
+    ]
+    ok = True
+    for description, passed in checks:
+        ok &= passed
+        print(f"  {'✓' if passed else '✗'} {description}")
+    return ok
+
+
+def main():
+    """Run all scan engine tests"""
+    print("\n🧪 SCAN ENGINE TEST SUITE\n")
+
+    tests = [
+        ("Page Rules", test_page_rules),
+        ("Page Rules (fallbacks)", test_page_rules_fallback),
+        ("HTTP Tier", test_http_tier),
+        ("Block Tracker", test_block_tracker),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"\n✗ {test_name} FAILED: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_name, False))
+
+    print("\n" + "=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    for test_name, result in results:
+        print(f"{'✓ PASS' if result else '✗ FAIL'}: {test_name}")
+    print(f"\nResults: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("\n🎉 All scan engine tests passed!")
+        return True
+    print("\n⚠️  Some tests failed. Please review the errors above.")
+    return False
+
+
+if __name__ == "__main__":
+    main()